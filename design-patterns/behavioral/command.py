@@ -1,3 +1,5 @@
+import random
+import sys
 from abc import ABC, abstractmethod
 
 
@@ -10,6 +12,10 @@ class Command(ABC):
     def undo(self):
         pass
 
+    def size(self):
+        """Approximate bytes held by this command (for bounded histories)."""
+        return sys.getsizeof(self)
+
 
 class TypeTextCommand(Command):
     def __init__(self, editor, text):
@@ -22,16 +28,222 @@ class TypeTextCommand(Command):
     def undo(self):
         self.editor.delete_text(len(self.text))
 
+    def size(self):
+        return sys.getsizeof(self) + sys.getsizeof(self.text)
+
+
+class InsertTextCommand(Command):
+    def __init__(self, editor, position, text):
+        self.editor = editor
+        self.position = position
+        self.text = text
+
+    def execute(self):
+        self.editor.insert_text(self.position, self.text)
+
+    def undo(self):
+        self.editor.delete_range(self.position, len(self.text))
+
+    def size(self):
+        return sys.getsizeof(self) + sys.getsizeof(self.text)
+
+
+class DeleteTextCommand(Command):
+    """
+    Keeps the buffer's delta for undo: the removed text for StringBuffer,
+    the removed pieces (references, no copy) for PieceTable.
+    """
+
+    def __init__(self, editor, position, length):
+        self.editor = editor
+        self.position = position
+        self.length = length
+        self.delta = None
+
+    def execute(self):
+        self.delta = self.editor.delete_range(self.position, self.length)
+
+    def undo(self):
+        self.editor.restore(self.position, self.delta)
+
+    def size(self):
+        delta = sys.getsizeof(self.delta) if isinstance(self.delta, str) else 0
+        return sys.getsizeof(self) + delta
+
+
+class StringBuffer:
+    """
+    Plain string backend, every edit copies the whole document: O(n).
+    """
+
+    def __init__(self, text=""):
+        self.text = text
+
+    def __len__(self):
+        return len(self.text)
+
+    def __str__(self):
+        return self.text
+
+    def insert(self, position, text):
+        self.text = self.text[:position] + text + self.text[position:]
+
+    def delete(self, position, length):
+        removed = self.text[position:position + length]
+        self.text = self.text[:position] + self.text[position + length:]
+        return removed
+
+    def restore(self, position, delta):
+        self.insert(position, delta)
+
+
+class _Piece:
+    """
+    Treap node for one piece: source[start:start + length].
+    `total` is the text length of the whole subtree (implicit key = position).
+    """
+    __slots__ = ("source", "start", "length", "total", "priority", "left", "right")
+
+    def __init__(self, source, start, length):
+        self.source = source
+        self.start = start
+        self.length = length
+        self.total = length
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+
+
+def _total(piece):
+    return piece.total if piece else 0
+
+
+def _pull(piece):
+    piece.total = piece.length + _total(piece.left) + _total(piece.right)
+    return piece
+
+
+class PieceTable:
+    """
+    Piece table backend.
+
+    The document is a sequence of pieces, each pointing into an immutable source string:
+    the original text or a string that was typed. Text is never copied or moved,
+    edits only split / relink pieces.
+
+        original: "Hello world"    added: ", dear"
+        pieces:   [orig 0..5] [added 0..6] [orig 5..11]  ->  "Hello, dear world"
+
+    Pieces live in a treap ordered by position (implicit key = subtree text length),
+    so finding, splitting and joining at any offset is O(log p), p = number of pieces.
+    delete() returns the removed subtree of pieces; restore() links it back.
+    """
+
+    def __init__(self, text=""):
+        self.root = _Piece(text, 0, len(text)) if text else None
+
+    def __len__(self):
+        return _total(self.root)
+
+    def __str__(self):
+        return "".join(self._chunks())
+
+    def _chunks(self):
+        stack = []
+        piece = self.root
+        while piece or stack:
+            while piece:
+                stack.append(piece)
+                piece = piece.left
+            piece = stack.pop()
+            yield piece.source[piece.start:piece.start + piece.length]
+            piece = piece.right
+
+    def _split(self, piece, position):
+        """
+        (first `position` characters, rest). A piece straddling the cut is split in two.
+        Time Complexity: O(log p) expected
+        """
+        if piece is None:
+            return None, None
+        left_total = _total(piece.left)
+        if position <= left_total:
+            left, piece.left = self._split(piece.left, position)
+            return left, _pull(piece)
+        if position >= left_total + piece.length:
+            piece.right, right = self._split(piece.right, position - left_total - piece.length)
+            return _pull(piece), right
+        cut = position - left_total
+        tail = _Piece(piece.source, piece.start + cut, piece.length - cut)
+        tail.priority = piece.priority  # keeps heap order over piece.right
+        tail.right, piece.right = piece.right, None
+        piece.length = cut
+        return _pull(piece), _pull(tail)
+
+    def _merge(self, left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            return _pull(left)
+        right.left = self._merge(left, right.left)
+        return _pull(right)
+
+    def insert(self, position, text):
+        """
+        Time Complexity: O(log p) expected
+        """
+        if text:
+            left, right = self._split(self.root, position)
+            self.root = self._merge(self._merge(left, _Piece(text, 0, len(text))), right)
+
+    def delete(self, position, length):
+        """
+        Time Complexity: O(log p) expected, returns the removed pieces
+        """
+        left, rest = self._split(self.root, position)
+        removed, right = self._split(rest, length)
+        self.root = self._merge(left, right)
+        return removed
+
+    def restore(self, position, delta):
+        left, right = self._split(self.root, position)
+        self.root = self._merge(self._merge(left, delta), right)
+
 
 class TextEditor:
-    def __init__(self):
-        self.content = ""
+    def __init__(self, buffer=None):
+        self.buffer = buffer if buffer is not None else StringBuffer()
+
+    @property
+    def content(self):
+        return str(self.buffer)
 
     def type_text(self, text):
-        self.content += text
+        self.buffer.insert(len(self.buffer), text)
 
     def delete_text(self, length):
-        self.content = self.content[:-length]
+        return self.buffer.delete(len(self.buffer) - length, length)
+
+    def insert_text(self, position, text):
+        self.buffer.insert(position, text)
+
+    def delete_range(self, position, length):
+        return self.buffer.delete(position, length)
+
+    def restore(self, position, delta):
+        self.buffer.restore(position, delta)
+
+    def snapshot(self):
+        return str(self.buffer)
+
+    def load(self, text):
+        self.buffer = type(self.buffer)(text)
+
+    def __len__(self):
+        return len(self.buffer)
 
     def __str__(self):
         return self.content
@@ -60,6 +272,206 @@ class TextEditorInvoker:
             self.history.append(command)
 
 
+class Checkpoint:
+    """
+    Snapshot of the document, kept in the history right after the command that produced it.
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.snapshot = editor.snapshot()
+
+    def size(self):
+        return sys.getsizeof(self) + sys.getsizeof(self.snapshot)
+
+
+class CheckpointJump(Command):
+    """
+    Undo step that replaces the evicted commands between two checkpoints:
+    the document jumps from one snapshot straight to the older one.
+    """
+
+    def __init__(self, newer, older):
+        self.newer = newer
+        self.older = older
+
+    def execute(self):
+        self.newer.editor.load(self.newer.snapshot)
+
+    def undo(self):
+        self.older.editor.load(self.older.snapshot)
+
+    def size(self):
+        return sys.getsizeof(self) + self.newer.size()
+
+
+class BoundedTextEditorInvoker(TextEditorInvoker):
+    """
+    TextEditorInvoker with a memory budget for undo history.
+
+    - every `compact_every` commands, runs of adjacent typing commands are merged into one
+      (one undo then removes the whole run, like most editors)
+    - every `snapshot_every` commands a Checkpoint of the document is appended to history,
+      unless the document is over half of max_bytes (the copy would crowd out the commands)
+    - the budget covers commands, their deltas and checkpoints, but not the base: the
+      checkpoint at history[0] that undo bottoms out at
+    - over budget: compact, then evict the oldest commands up to the next checkpoint;
+      the evicted span is replaced by that checkpoint, older checkpoints are archived
+    - undo past the oldest kept command jumps to the nearest archived checkpoint
+    - archived checkpoints are dropped oldest first if still over budget
+    - no checkpoint to cut at: drop the oldest commands (and the base) down to 3/4 of
+      the budget, the last command is always kept so undo keeps working
+    """
+
+    def __init__(self, max_bytes=1 << 20, snapshot_every=1000, compact_every=100):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.snapshot_every = snapshot_every
+        self.compact_every = compact_every
+        self.archived = []      # checkpoints whose following commands were evicted
+        self.bytes = 0          # everything but the base checkpoint
+        self.executed = 0
+        self.compacted = 0      # history[:compacted] is already compacted
+
+    def execute_command(self, command):
+        command.execute()
+        for entry in self.redo_stack:
+            self.bytes -= entry.size()
+        self.redo_stack.clear()
+        self._push(command)
+        self.executed += 1
+        if self.executed % self.compact_every == 0:
+            self.compact()
+        if self.executed % self.snapshot_every == 0 and 2 * len(command.editor) <= self.max_bytes:
+            self._push(Checkpoint(command.editor))
+        if self.bytes > self.max_bytes:
+            self._enforce_budget()
+
+    def _push(self, entry):
+        self.history.append(entry)
+        self.bytes += entry.size()
+
+    def undo(self):
+        # checkpoints on top belong after the command below them, move them along
+        while self.history and isinstance(self.history[-1], Checkpoint) and len(self.history) > 1:
+            self.redo_stack.append(self.history.pop())
+        if not self.history:
+            return
+        top = self.history[-1]
+        if isinstance(top, Checkpoint):
+            # only the base checkpoint is left, jump to the nearest archived one
+            if not self.archived:
+                return
+            older = self.archived.pop()
+            jump = CheckpointJump(self.history.pop(), older)
+            jump.undo()
+            self.history.append(older)  # the new base
+            self.redo_stack.append(jump)
+            self.bytes += jump.size() - older.size()
+        else:
+            self.history.pop().undo()
+            self.redo_stack.append(top)
+        self.compacted = min(self.compacted, len(self.history))
+
+    def redo(self):
+        if not self.redo_stack:
+            return
+        entry = self.redo_stack.pop()
+        if isinstance(entry, CheckpointJump):
+            entry.execute()
+            self.archived.append(self.history.pop())
+            self.history.append(entry.newer)  # the base again
+            self.bytes -= entry.size() - entry.older.size()
+        else:
+            entry.execute()
+            self.history.append(entry)
+        while self.redo_stack and isinstance(self.redo_stack[-1], Checkpoint):
+            self.history.append(self.redo_stack.pop())
+
+    def _mergeable(self, prev, command):
+        if type(prev) is not type(command) or prev.editor is not command.editor:
+            return False
+        if isinstance(command, TypeTextCommand):
+            return True
+        if isinstance(command, InsertTextCommand):
+            return command.position == prev.position + len(prev.text)
+        return False
+
+    def compact(self):
+        """
+        Merge runs of adjacent typing commands in the not yet compacted tail.
+        Time Complexity: O(new entries)
+        """
+        start = max(0, self.compacted - 1)
+        merged = self.history[:start]
+        for entry in self.history[start:]:
+            prev = merged[-1] if merged else None
+            if prev is not None and self._mergeable(prev, entry):
+                self.bytes -= prev.size() + entry.size()
+                if isinstance(entry, TypeTextCommand):
+                    prev = TypeTextCommand(entry.editor, prev.text + entry.text)
+                else:
+                    prev = InsertTextCommand(entry.editor, prev.position, prev.text + entry.text)
+                merged[-1] = prev
+                self.bytes += prev.size()
+            else:
+                merged.append(entry)
+        self.history = merged
+        self.compacted = len(merged)
+
+    def _drop_front(self, k):
+        """Evict history[:k], whatever checkpoint ends up at history[0] becomes the base."""
+        evicted, self.history = self.history[:k], self.history[k:]
+        for i, entry in enumerate(evicted):
+            if i or not isinstance(entry, Checkpoint):
+                self.bytes -= entry.size()
+        if self.history and isinstance(self.history[0], Checkpoint):
+            self.bytes -= self.history[0].size()
+        self.compacted = max(0, self.compacted - k)
+
+    def _enforce_budget(self):
+        self.compact()
+        while self.bytes > self.max_bytes:
+            # first checkpoint after the base that still has a command after it
+            cut = next((i for i in range(1, len(self.history) - 1)
+                        if isinstance(self.history[i], Checkpoint)), None)
+            if cut is not None:
+                base = self.history[0] if isinstance(self.history[0], Checkpoint) else None
+                self._drop_front(cut)
+                if base is not None:
+                    self.archived.append(base)
+                    self.bytes += base.size()
+            elif self.archived:
+                self.bytes -= self.archived.pop(0).size()
+            else:
+                # nothing to jump back to: the base no longer matches once the commands
+                # after it are gone, drop it too; batch down to 3/4 so this runs rarely
+                last = max((i for i, entry in enumerate(self.history)
+                            if not isinstance(entry, Checkpoint)), default=0)
+                excess = self.bytes - self.max_bytes * 3 // 4
+                k = freed = 0
+                while k < last and freed < excess:
+                    if k or not isinstance(self.history[0], Checkpoint):
+                        freed += self.history[k].size()
+                    k += 1
+                if not k:
+                    return
+                self._drop_front(k)
+
+    def memory_usage(self):
+        commands = [entry for entry in self.history + self.redo_stack if not isinstance(entry, Checkpoint)]
+        checkpoints = [entry for entry in self.history + self.redo_stack if isinstance(entry, Checkpoint)]
+        checkpoints += self.archived
+        return {
+            "commands": len(commands),
+            "command_bytes": sum(entry.size() for entry in commands),
+            "checkpoints": len(checkpoints),
+            "checkpoint_bytes": sum(entry.size() for entry in checkpoints),
+            "total_bytes": self.bytes,  # without the base checkpoint
+            "max_bytes": self.max_bytes,
+        }
+
+
 if __name__ == "__main__":
     editor = TextEditor()
     invoker = TextEditorInvoker()
@@ -76,3 +488,20 @@ if __name__ == "__main__":
 
     invoker.redo()
     print(editor)  # Output: Hello, world!
+
+    # same commands on a piece table backend, edits in the middle of the text
+    editor = TextEditor(PieceTable("Hello world"))
+    invoker = TextEditorInvoker()
+    invoker.execute_command(InsertTextCommand(editor, 5, ", dear"))
+    print(editor)  # Output: Hello, dear world
+    invoker.execute_command(DeleteTextCommand(editor, 0, 7))
+    print(editor)  # Output: dear world
+    invoker.undo()
+    print(editor)  # Output: Hello, dear world
+
+    # bounded history: typing runs get compacted, old commands give way to checkpoints
+    editor = TextEditor()
+    invoker = BoundedTextEditorInvoker(max_bytes=4096, snapshot_every=50, compact_every=10)
+    for i in range(1000):
+        invoker.execute_command(TypeTextCommand(editor, str(i % 10)))
+    print(invoker.memory_usage())
@@ -0,0 +1,74 @@
+"""
+Benchmark: TextEditor with StringBuffer vs PieceTable backend.
+
+Random inserts / deletes / undos at arbitrary positions through TextEditorInvoker.
+
+    python command_benchmark.py [document_mb] [edits]
+
+Defaults to 10 MB / 10^5 edits, the target workload is 100 MB / 10^6 edits.
+StringBuffer copies the whole document on every edit, so it only runs a sample
+of the edits and the total is extrapolated.
+
+bounded_history: BoundedTextEditorInvoker on a document larger than max_bytes,
+checks that undo still works and that the cost per command stays flat.
+"""
+import random
+import sys
+import time
+
+from command import (BoundedTextEditorInvoker, DeleteTextCommand, InsertTextCommand, PieceTable,
+                     StringBuffer, TextEditor, TextEditorInvoker)
+
+
+def run(editor, edits, seed=0):
+    rng = random.Random(seed)
+    invoker = TextEditorInvoker()
+    start = time.perf_counter()
+    for _ in range(edits):
+        r = rng.random()
+        n = len(editor)
+        if r < 0.5:
+            invoker.execute_command(InsertTextCommand(editor, rng.randint(0, n), "edit"))
+        elif r < 0.8:
+            position = rng.randint(0, n)
+            invoker.execute_command(DeleteTextCommand(editor, position, min(16, n - position)))
+        else:
+            invoker.undo()
+    return time.perf_counter() - start
+
+
+def bounded_history(document_mb=20, max_bytes=1 << 20, batches=6, batch=5000, seed=0):
+    rng = random.Random(seed)
+    editor = TextEditor(PieceTable("lorem ipsum " * (document_mb * 2**20 // 12)))
+    invoker = BoundedTextEditorInvoker(max_bytes=max_bytes)
+    times = []
+    for _ in range(batches):
+        start = time.perf_counter()
+        for _ in range(batch):
+            invoker.execute_command(InsertTextCommand(editor, rng.randint(0, len(editor)), "edit"))
+        times.append(time.perf_counter() - start)
+    usage = invoker.memory_usage()
+    assert usage["total_bytes"] <= max_bytes and usage["commands"] > 0
+    assert max(times[1:]) < 5 * times[0], times  # no full-document copies per command
+    before = len(editor)
+    invoker.undo()
+    assert len(editor) == before - len("edit")
+    print(f"bounded history, {document_mb} MB document, {max_bytes} byte budget: "
+          f"{', '.join(f'{t:.2f}' for t in times)} s per {batch} commands, "
+          f"{usage['commands']} commands kept")
+
+
+def main(document_mb=10, edits=10**5):
+    document = "lorem ipsum " * (document_mb * 2**20 // 12)
+    piece_time = run(TextEditor(PieceTable(document)), edits)
+    sample = max(1, min(edits, 200))
+    string_time = run(TextEditor(StringBuffer(document)), sample) * edits / sample
+    print(f"document {len(document) / 2**20:.0f} MB, {edits} edits")
+    print(f"PieceTable:   {piece_time:10.2f} s")
+    print(f"StringBuffer: {string_time:10.2f} s (extrapolated from {sample} edits)")
+    bounded_history()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,379 @@
+"""
+ARRAY-BACKED (POOLED) LINKED LIST
+"""
+
+"""
+1. WHY?
+   - Node object per element: object header + value ref + next (+ prev) refs,
+     ~56 bytes with __slots__, ~150 bytes with a __dict__, plus the boxed value
+   - 10^7 queue entries -> over a GB just for nodes
+
+2. IDEA: struct of arrays + index "pointers"
+   - Node i is a slot in parallel buffers:
+        values[i]  value (array typecode, e.g. 'q' -> 8 bytes unboxed)
+        next[i]    slot of the next node  (array('i') -> 4 bytes)
+        prev[i]    slot of the previous node (doubly only)
+   - NIL = -1 plays the role of None
+
+        slot:    0    1    2    3
+        values: [10,  30,  20,  --]        head = 0, tail = 1
+        next:   [ 2,  -1,   1,  -1]        list: 10 -> 20 -> 30
+                                     free = 3
+
+3. FREE LIST:
+   - Deleted slots are chained through next[] starting at `free`
+   - New nodes reuse a free slot before growing the buffers
+   - Queue-like workloads (append + delete(0)) run in a fixed-size pool
+
+4. API:
+   - Same methods as SinglyLinkedList / DoublyLinkedList
+   - get() / iteration return light ArrayNode views (slot + owner), created on access
+   - typecode=None stores values in a plain list (any object, no unboxing)
+"""
+
+import time
+import tracemalloc
+from array import array
+
+NIL = -1
+
+
+class ArrayNode:
+    """
+    View on one slot, mirrors Node (value / next) without owning any storage.
+    """
+    __slots__ = ("owner", "slot")
+
+    def __init__(self, owner, slot):
+        self.owner = owner
+        self.slot = slot
+
+    @property
+    def value(self):
+        return self.owner.values[self.slot]
+
+    @value.setter
+    def value(self, value):
+        self.owner.values[self.slot] = value
+
+    @property
+    def next(self):
+        slot = self.owner.next[self.slot]
+        return ArrayNode(self.owner, slot) if slot != NIL else None
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return str(self.value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+
+class _ArrayLinkedList:
+    DOUBLY = False
+
+    def __init__(self, values=(), typecode="q"):
+        self.typecode = typecode
+        self.clear()
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        self.values = array(self.typecode) if self.typecode else []
+        self.next = array('i')
+        self.prev = array('i') if self.DOUBLY else None
+        self.head = NIL
+        self.tail = NIL
+        self.free = NIL
+        self.size = 0
+
+    def _alloc(self, value):
+        """
+        Take a slot from the free list or grow the buffers.
+        Time Complexity: O(1) amortized
+        """
+        if self.free != NIL:
+            slot = self.free
+            self.free = self.next[slot]
+            self.values[slot] = value
+        else:
+            slot = len(self.values)
+            self.values.append(value)
+            self.next.append(NIL)
+            if self.DOUBLY:
+                self.prev.append(NIL)
+        return slot
+
+    def _release(self, slot):
+        if not self.typecode:
+            self.values[slot] = None  # drop the reference
+        self.next[slot] = self.free
+        self.free = slot
+
+    def _slot_at(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError('Index out of range')
+        if self.DOUBLY and index >= self.size // 2:
+            slot = self.tail
+            for _ in range(self.size - index - 1):
+                slot = self.prev[slot]
+            return slot
+        slot = self.head
+        for _ in range(index):
+            slot = self.next[slot]
+        return slot
+
+    def _slots(self):
+        slot, nxt = self.head, self.next
+        while slot != NIL:
+            yield slot
+            slot = nxt[slot]
+
+    def __str__(self):
+        return str(self.to_list())
+
+    def __repr__(self):
+        return str(self.to_list())
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for slot in self._slots():
+            yield ArrayNode(self, slot)
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def __setitem__(self, index, value):
+        self.set(index, value)
+
+    def __delitem__(self, index):
+        self.delete(index)
+
+    def __eq__(self, other):
+        if len(self) != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def to_list(self):
+        values = self.values
+        return [values[slot] for slot in self._slots()]
+
+    def get(self, index):
+        return ArrayNode(self, self._slot_at(index))
+
+    def set(self, index, value):
+        self.values[self._slot_at(index)] = value
+
+    def append(self, value):
+        self.insert(self.size, value)
+
+    def prepend(self, value):
+        self.insert(0, value)
+
+    def pop(self):
+        value = self.values[self.tail] if self.size else None
+        self.delete(self.size - 1)
+        return value
+
+    def popleft(self):
+        value = self.values[self.head] if self.size else None
+        self.delete(0)
+        return value
+
+    def count(self, value):
+        values = self.values
+        return sum(1 for slot in self._slots() if values[slot] == value)
+
+    def index(self, value):
+        values = self.values
+        for i, slot in enumerate(self._slots()):
+            if values[slot] == value:
+                return i
+        raise ValueError('Value not found')
+
+    def remove(self, value):
+        values = self.values
+        for i, slot in enumerate(self._slots()):
+            if values[slot] == value:
+                self.delete(i)
+                return True
+        return False
+
+    def extend(self, other):
+        for node in other:
+            self.append(node.value)
+
+    def copy(self):
+        new_list = type(self)(typecode=self.typecode)
+        for value in self.to_list():
+            new_list.append(value)
+        return new_list
+
+    def compact(self):
+        """
+        Rebuild the buffers in list order without free slots.
+        Time Complexity: O(n)
+        """
+        values = self.to_list()
+        self.clear()
+        for value in values:
+            self.append(value)
+
+
+class ArraySinglyLinkedList(_ArrayLinkedList):
+
+    def insert(self, index, value):
+        if index < 0 or index > self.size:
+            raise IndexError('Index out of range')
+        slot = self._alloc(value)
+        nxt = self.next
+        if index == 0:
+            nxt[slot] = self.head
+            self.head = slot
+            if self.tail == NIL:
+                self.tail = slot
+        elif index == self.size:
+            nxt[slot] = NIL
+            nxt[self.tail] = slot
+            self.tail = slot
+        else:
+            prev = self._slot_at(index - 1)
+            nxt[slot] = nxt[prev]
+            nxt[prev] = slot
+        self.size += 1
+
+    def delete(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError('Index out of range')
+        nxt = self.next
+        if index == 0:
+            slot = self.head
+            self.head = nxt[slot]
+            if self.head == NIL:
+                self.tail = NIL
+        else:
+            prev = self._slot_at(index - 1)
+            slot = nxt[prev]
+            nxt[prev] = nxt[slot]
+            if slot == self.tail:
+                self.tail = prev
+        self._release(slot)
+        self.size -= 1
+
+    def reverse(self):
+        nxt = self.next
+        prev, slot = NIL, self.head
+        while slot != NIL:
+            nxt[slot], prev, slot = prev, slot, nxt[slot]
+        self.head, self.tail = prev, self.head
+
+
+class ArrayDoublyLinkedList(_ArrayLinkedList):
+    DOUBLY = True
+
+    def insert(self, index, value):
+        if index < 0 or index > self.size:
+            raise IndexError('Index out of range')
+        slot = self._alloc(value)
+        nxt, prv = self.next, self.prev
+        if index == self.size:
+            before, after = self.tail, NIL
+        else:
+            after = self._slot_at(index)
+            before = prv[after]
+        nxt[slot], prv[slot] = after, before
+        if before == NIL:
+            self.head = slot
+        else:
+            nxt[before] = slot
+        if after == NIL:
+            self.tail = slot
+        else:
+            prv[after] = slot
+        self.size += 1
+
+    def delete(self, index):
+        slot = self._slot_at(index)
+        nxt, prv = self.next, self.prev
+        before, after = prv[slot], nxt[slot]
+        if before == NIL:
+            self.head = after
+        else:
+            nxt[before] = after
+        if after == NIL:
+            self.tail = before
+        else:
+            prv[after] = before
+        self._release(slot)
+        self.size -= 1
+
+    def reverse(self):
+        nxt, prv = self.next, self.prev
+        for slot in list(self._slots()):
+            nxt[slot], prv[slot] = prv[slot], nxt[slot]
+        self.head, self.tail = self.tail, self.head
+
+
+"""
+BENCHMARK: queue of n entries (append all, then pop from the front)
+
+Run from repo root: python -m dsa.basics.array_linked_list [n]
+Reports build + drain time and the memory held once all n entries are queued.
+"""
+
+
+def benchmark(n=10**6):
+    import importlib
+    from collections import deque
+
+    linked_list = importlib.import_module("dsa.basics.linked-list")
+
+    def drain(container):
+        if isinstance(container, deque):
+            while container:
+                container.popleft()
+        else:
+            for _ in range(len(container)):
+                container.delete(0)
+
+    candidates = (
+        ("SinglyLinkedList", linked_list.SinglyLinkedList),
+        ("DoublyLinkedList", linked_list.DoublyLinkedList),
+        ("ArraySinglyLinkedList", ArraySinglyLinkedList),
+        ("ArrayDoublyLinkedList", ArrayDoublyLinkedList),
+        ("deque", deque),
+    )
+    print(f"{'container':<24}{'append (s)':>12}{'drain (s)':>12}{'memory (MB)':>14}")
+    for name, factory in candidates:
+        container = factory()
+        start = time.perf_counter()
+        for i in range(n):
+            container.append(i)
+        append_time = time.perf_counter() - start
+        start = time.perf_counter()
+        drain(container)
+        drain_time = time.perf_counter() - start
+
+        tracemalloc.start()
+        container = factory()
+        for i in range(n):
+            container.append(i)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del container
+        print(f"{name:<24}{append_time:>12.2f}{drain_time:>12.2f}{memory / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
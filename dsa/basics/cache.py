@@ -0,0 +1,383 @@
+"""
+CACHES: LRU / LFU / TTL
+"""
+
+"""
+1. BUILDING BLOCK: HASH MAP + DOUBLY LINKED LIST
+   - map[key] -> list node, so a hit finds its node in O(1)
+   - DoublyLinkedList.unlink(node) / move_to_end(node) relink in O(1)
+     (delete(index) and remove(value) would walk the list: O(n))
+   - list order encodes the eviction order, victim is always at the head
+
+2. POLICIES:
+   - LRU: hit -> move node to tail, evict head (least recently used)
+   - LFU: one list per frequency, the lists themselves kept in a list ordered by frequency
+        hit   -> move node from list[f] to list[f + 1] (created right after list[f]),
+                 drop list[f] if it emptied
+        evict -> head of the first list (least frequent, LRU among ties)
+   - TTL: list ordered by write time, every entry expires `ttl` seconds after its write
+        expired entries are dropped lazily on get and from the head on put
+        when full, evict the oldest write (FIFO)
+
+3. BOUNDS:
+   - capacity: max number of entries
+   - max_bytes: max total of sizeof(key, value) (default sys.getsizeof(value))
+   - an item larger than max_bytes on its own is not cached
+
+4. COUNTERS: hits, misses, evictions (+ expirations for TTL)
+
+        get / put / evict: O(1)
+"""
+
+import importlib
+import sys
+from abc import ABC, abstractmethod
+import threading
+import time
+
+_linked_list = importlib.import_module("dsa.basics.linked-list")
+DoublyLinkedList = _linked_list.DoublyLinkedList
+DoublyNode = _linked_list.DoublyNode
+
+
+class _Entry(DoublyNode):
+    __slots__ = ("key", "nbytes", "freq", "expires")
+
+    def __init__(self, key, value, nbytes):
+        super().__init__(value)
+        self.key = key
+        self.nbytes = nbytes
+        self.freq = 1
+        self.expires = None
+
+
+class _Cache(ABC):
+
+    def __init__(self, capacity=None, max_bytes=None, sizeof=None):
+        if capacity is None and max_bytes is None:
+            raise ValueError("Either capacity or max_bytes is required")
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda key, value: sys.getsizeof(value))
+        self.map = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.map)
+
+    def __contains__(self, key):
+        node = self.map.get(key)
+        return node is not None and not self._expired(node)
+
+    # --- policy hooks -----------------------------------------------------------------
+
+    @abstractmethod
+    def _link(self, node):
+        pass
+
+    @abstractmethod
+    def _unlink(self, node):
+        pass
+
+    @abstractmethod
+    def _touch(self, node):
+        pass
+
+    @abstractmethod
+    def _victim(self):
+        pass
+
+    @abstractmethod
+    def _after(self, node):
+        """Next victim after node in eviction order, None if node is the last."""
+
+    def _expired(self, node):
+        return False
+
+    def _on_write(self, node):
+        self._touch(node)
+
+    # --- shared logic -----------------------------------------------------------------
+
+    def _over_budget(self, extra_entries, extra_bytes):
+        if self.capacity is not None and len(self.map) + extra_entries > self.capacity:
+            return True
+        return self.max_bytes is not None and self.bytes + extra_bytes > self.max_bytes
+
+    def _remove(self, node):
+        self._unlink(node)
+        del self.map[node.key]
+        self.bytes -= node.nbytes
+
+    def _evict(self, extra_entries, extra_bytes, keep=None):
+        while self.map and self._over_budget(extra_entries, extra_bytes):
+            victim = self._victim()
+            if victim is keep:
+                victim = self._after(keep)
+                if victim is None:
+                    break
+            self._remove(victim)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        node = self.map.get(key)
+        if node is None or self._expired(node):
+            if node is not None:
+                self._remove(node)
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key, value):
+        nbytes = self.sizeof(key, value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            self.pop(key)
+            return
+        node = self.map.get(key)
+        if node is not None:
+            self.bytes += nbytes - node.nbytes
+            node.value, node.nbytes = value, nbytes
+            self._on_write(node)
+            self._evict(0, 0, keep=node)
+            return
+        self._evict(1, nbytes)
+        node = _Entry(key, value, nbytes)
+        self.map[key] = node
+        self.bytes += nbytes
+        self._link(node)
+
+    def pop(self, key, default=None):
+        node = self.map.get(key)
+        if node is None:
+            return default
+        self._remove(node)
+        return node.value
+
+    def clear(self):
+        for node in list(self.map.values()):
+            self._remove(node)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.map),
+            "bytes": self.bytes,
+        }
+
+
+class LRUCache(_Cache):
+
+    def __init__(self, capacity=None, max_bytes=None, sizeof=None):
+        super().__init__(capacity, max_bytes, sizeof)
+        self.order = DoublyLinkedList()
+
+    def _link(self, node):
+        self.order.append_node(node)
+
+    def _unlink(self, node):
+        self.order.unlink(node)
+
+    def _touch(self, node):
+        self.order.move_to_end(node)
+
+    def _victim(self):
+        return self.order.head
+
+    def _after(self, node):
+        return node.next
+
+
+class _FreqBucket(DoublyNode):
+    """Node of LFUCache.buckets, value is the DoublyLinkedList of entries with this freq."""
+    __slots__ = ("freq",)
+
+    def __init__(self, freq):
+        super().__init__(DoublyLinkedList())
+        self.freq = freq
+
+
+class LFUCache(_Cache):
+
+    def __init__(self, capacity=None, max_bytes=None, sizeof=None):
+        super().__init__(capacity, max_bytes, sizeof)
+        self.freq_lists = {}
+        self.buckets = DoublyLinkedList()
+
+    def _bucket_after(self, prev, freq):
+        bucket = self.freq_lists.get(freq)
+        if bucket is None:
+            bucket = self.freq_lists[freq] = _FreqBucket(freq)
+            self.buckets.insert_node_after(prev, bucket)
+        return bucket
+
+    def _drop_if_empty(self, bucket):
+        if not bucket.value.size:
+            self.buckets.unlink(bucket)
+            del self.freq_lists[bucket.freq]
+
+    def _link(self, node):
+        node.freq = 1
+        self._bucket_after(None, 1).value.append_node(node)
+
+    def _unlink(self, node):
+        bucket = self.freq_lists[node.freq]
+        bucket.value.unlink(node)
+        self._drop_if_empty(bucket)
+
+    def _touch(self, node):
+        bucket = self.freq_lists[node.freq]
+        bucket.value.unlink(node)
+        node.freq += 1
+        self._bucket_after(bucket, node.freq).value.append_node(node)
+        self._drop_if_empty(bucket)
+
+    def _victim(self):
+        return self.buckets.head.value.head
+
+    def _after(self, node):
+        if node.next:
+            return node.next
+        bucket = self.freq_lists[node.freq].next
+        return bucket.value.head if bucket else None
+
+
+class TTLCache(_Cache):
+
+    def __init__(self, ttl, capacity=None, max_bytes=None, sizeof=None, clock=time.monotonic):
+        super().__init__(capacity, max_bytes, sizeof)
+        self.ttl = ttl
+        self.clock = clock
+        self.order = DoublyLinkedList()
+        self.expirations = 0
+
+    def _expired(self, node):
+        return node.expires <= self.clock()
+
+    def _purge_expired(self):
+        now = self.clock()
+        while self.order.head and self.order.head.expires <= now:
+            self._remove(self.order.head)
+            self.expirations += 1
+
+    def _link(self, node):
+        node.expires = self.clock() + self.ttl
+        self.order.append_node(node)
+
+    def _unlink(self, node):
+        self.order.unlink(node)
+
+    def _touch(self, node):
+        pass  # reads do not extend the lifetime
+
+    def _on_write(self, node):
+        node.expires = self.clock() + self.ttl
+        self.order.move_to_end(node)
+
+    def _victim(self):
+        return self.order.head
+
+    def _after(self, node):
+        return node.next
+
+    def get(self, key, default=None):
+        node = self.map.get(key)
+        if node is not None and self._expired(node):
+            self.expirations += 1
+        return super().get(key, default)
+
+    def put(self, key, value):
+        self._purge_expired()
+        super().put(key, value)
+
+    def stats(self):
+        stats = super().stats()
+        stats["expirations"] = self.expirations
+        return stats
+
+
+class ThreadSafeCache:
+    """
+    Wraps any cache above, every call holds one lock (get mutates list order too).
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self.cache.get(key, default)
+
+    def put(self, key, value):
+        with self.lock:
+            self.cache.put(key, value)
+
+    def pop(self, key, default=None):
+        with self.lock:
+            return self.cache.pop(key, default)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+    def stats(self):
+        with self.lock:
+            return self.cache.stats()
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.cache
+
+    def __len__(self):
+        with self.lock:
+            return len(self.cache)
+
+
+"""
+BENCHMARK: LRUCache / LFUCache vs functools.lru_cache, Zipfian keys
+
+Run from repo root: python -m dsa.basics.cache [requests]
+"""
+
+
+def benchmark(requests=10**6, universe=10**5, capacity=10**4, s=1.1, seed=0):
+    import functools
+    import random
+
+    rng = random.Random(seed)
+    weights = [1 / (k ** s) for k in range(1, universe + 1)]
+    keys = rng.choices(range(universe), weights=weights, k=requests)
+
+    print(f"{'cache':<22}{'time (s)':>10}{'hit rate':>10}")
+
+    @functools.lru_cache(maxsize=capacity)
+    def load(key):
+        return key * 2
+
+    start = time.perf_counter()
+    for key in keys:
+        load(key)
+    info = load.cache_info()
+    print(f"{'functools.lru_cache':<22}{time.perf_counter() - start:>10.2f}"
+          f"{info.hits / (info.hits + info.misses):>10.3f}")
+
+    for name, cache in (("LRUCache", LRUCache(capacity)), ("LFUCache", LFUCache(capacity)),
+                        ("ThreadSafe(LRU)", ThreadSafeCache(LRUCache(capacity)))):
+        start = time.perf_counter()
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key * 2)
+        print(f"{name:<22}{time.perf_counter() - start:>10.2f}{cache.stats()['hit_rate']:>10.3f}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
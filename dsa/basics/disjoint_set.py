@@ -56,10 +56,14 @@ class DisjointSet:
         """
         if x not in self.parent:
             raise ValueError(f"Element {x} not found in any set")
+        # iterative: a recursive find overflows the stack on long chains
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
         # Path compression: make all nodes on path point directly to root
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
     
     def union(self, x, y):
         """
@@ -88,6 +92,351 @@ class DisjointSet:
             self.rank[root_x] += 1
         self.count -= 1  # Decrease number of sets
 
+"""
+ARRAY-BACKED INTEGER DSU
+
+When elements are 0..n-1, dicts are wasted memory (~100 bytes per entry).
+    - parent / size live in array('i'): 4 bytes each, contiguous
+    - the same buffers are viewed as NumPy arrays for bulk operations (no copy)
+    - union by size (size is also useful as an answer: component sizes)
+    - iterative find with PATH HALVING: every node on the path points to its grandparent
+        x -> p -> g -> ...  becomes  x -> g
+      one pass, no recursion, no second loop; same O(α(n)) amortized bound
+
+BULK OPERATIONS (NumPy, edge arrays far too large for a Python loop):
+    union_many(us, vs): rounds of "hooking" + "pointer jumping" (Shiloach-Vishkin style)
+        1) ru, rv = roots of both endpoints          (find_many)
+        2) for edges with ru != rv: parent[max(ru, rv)] = min(ru, rv)
+           conflicting writes to the same root: one wins, the rest retry next round
+           links always point to a smaller id -> no cycles
+        3) repeat until every edge has ru == rv
+      union by size is not kept across a bulk call, sizes are recomputed at the end
+    load_parent(parent): restore a saved forest, sizes / count recomputed the same way
+    find_many(xs): r = parent[r] for the whole array until nothing changes
+    component_labels(): compress everything, relabel roots to 0..k-1
+"""
+
+from array import array
+
+
+class IntDisjointSet:
+
+    def __init__(self, n):
+        self.n = n
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n
+
+    def find(self, x):
+        """
+        Time Complexity: O(α(n)) amortized
+        Space Complexity: O(1)
+        """
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """
+        Returns True if x and y were in different sets.
+        Time Complexity: O(α(n)) amortized
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x):
+        return self.size[self.find(x)]
+
+    def _arrays(self):
+        import numpy as np
+        return np, np.frombuffer(self.parent, dtype=np.int32), np.frombuffer(self.size, dtype=np.int32)
+
+    def _compress(self):
+        # pointer jumping over the whole forest until every node points at its root
+        np, parent, _ = self._arrays()
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                return parent
+            parent[:] = grand
+
+    def find_many(self, xs):
+        """
+        Roots of all xs (NumPy array).
+        Time Complexity: O(len(xs) * depth), depth is small after compression
+        """
+        np, parent, _ = self._arrays()
+        roots = np.asarray(xs, dtype=np.int32)
+        while True:
+            nxt = parent[roots]
+            if np.array_equal(nxt, roots):
+                return roots
+            roots = parent[nxt]  # two steps per round
+
+    def union_many(self, us, vs, chunk_size=1 << 22):
+        """
+        Union every (us[i], vs[i]) edge, processed in chunks to bound memory.
+        Time Complexity: O(E log n) worst, few rounds in practice
+        """
+        np, parent, size = self._arrays()
+        us = np.asarray(us, dtype=np.int32)
+        vs = np.asarray(vs, dtype=np.int32)
+        for start in range(0, len(us), chunk_size):
+            u = us[start:start + chunk_size]
+            v = vs[start:start + chunk_size]
+            while len(u):
+                ru, rv = self.find_many(u), self.find_many(v)
+                pending = ru != rv
+                ru, rv = ru[pending], rv[pending]
+                if not len(ru):
+                    break
+                parent[np.maximum(ru, rv)] = np.minimum(ru, rv)
+                u, v = ru, rv
+            self._compress()
+        self._recount()
+
+    def load_parent(self, parent):
+        """
+        Replace the forest with a saved parent array (e.g. a checkpoint), then rebuild
+        sizes and count from it.
+        Time Complexity: O(n log n) for the compression rounds
+        """
+        own = self._arrays()[1]
+        if len(parent) != self.n:
+            raise ValueError(f"Parent array has {len(parent)} nodes, expected {self.n}")
+        own[:] = parent
+        self._compress()
+        self._recount()
+
+    def _recount(self):
+        # requires a fully compressed forest: parent[x] is the root of x
+        np, roots, size = self._arrays()
+        is_root = roots == np.arange(self.n)
+        size[:] = np.where(is_root, np.bincount(roots, minlength=self.n), 1)
+        self.count = int(np.count_nonzero(is_root))
+
+    def component_labels(self):
+        """
+        Dense component id (0..count-1) for every element, ordered by smallest member.
+        Time Complexity: O(n log n) for the compression rounds
+        """
+        np = self._arrays()[0]
+        roots = self._compress()
+        # union by size: the root need not be the smallest member, its first occurrence is
+        _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.int32)
+        rank[np.argsort(first)] = np.arange(len(first), dtype=np.int32)
+        return rank[inverse.ravel()]
+
+
+"""
+ROLLBACK (UNDOABLE) DSU
+
+Path compression rewrites many parent pointers per find, so it cannot be undone cheaply.
+Without it, union by size alone keeps trees O(log n) deep and every union changes
+exactly one parent pointer + one size -> push that change on a history stack.
+    - snapshot(): current history length
+    - rollback(snapshot): pop and revert unions until history is that long
+    - find: O(log n), union: O(log n), rollback: O(1) per undone union
+Used for offline dynamic connectivity (edges that also get deleted), see
+graph-algos/dynamic-connectivity.py.
+"""
+
+
+class RollbackDisjointSet:
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n
+        self.history = []  # root that got attached, one entry per successful union
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.count -= 1
+        self.history.append(root_y)
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def snapshot(self):
+        return len(self.history)
+
+    def rollback(self, snapshot):
+        while len(self.history) > snapshot:
+            root_y = self.history.pop()
+            root_x = self.parent[root_y]
+            self.size[root_x] -= self.size[root_y]
+            self.parent[root_y] = root_y
+            self.count += 1
+
+
+"""
+WEIGHTED (POTENTIAL) DSU
+
+Constraints of the form  value(x) - value(y) = w  (time offsets, relative positions, ...).
+    - every node keeps pot[x] = value(x) - value(parent[x])
+    - after find, pot[x] is relative to the root, so
+        diff(x, y) = pot[x] - pot[y]    (only defined when x and y share a root)
+    - union(x, y, w) on two roots: hang root_y under root_x with
+        pot[root_y] = pot[x] - pot[y] - w
+    - union inside one set is a CHECK: pot[x] - pot[y] == w, otherwise a conflict
+    - path compression must keep potentials right: walk the path top-down,
+      pot[x] += pot[parent[x]] (parent already relative to the root), then parent[x] = root
+
+PARITY DSU: the same with w in {0, 1} and XOR instead of +/-
+    - parity[x] = 1 if x and its parent are on different sides
+    - union(x, y, 1) = "x and y differ" -> an edge of a bipartite graph
+    - conflict = odd cycle = the graph stops being bipartite
+"""
+
+
+class WeightedDisjointSet:
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.pot = [0] * n  # list, so w may be int, float or Fraction
+        self.count = n
+        self.conflicts = 0
+
+    def find(self, x):
+        """
+        Root of x, pot[x] becomes value(x) - value(root) on the way.
+        Time Complexity: O(α(n)) amortized
+        """
+        parent, pot = self.parent, self.pot
+        path = []
+        while parent[x] != x:
+            path.append(x)
+            x = parent[x]
+        # full compression from the top so every pot on the path is relative to the root
+        for node in reversed(path):
+            if parent[node] != x:
+                pot[node] += pot[parent[node]]
+                parent[node] = x
+        return x
+
+    def union(self, x, y, w):
+        """
+        Add the constraint value(x) - value(y) = w.
+        Returns False if it contradicts earlier constraints (nothing is changed).
+        Time Complexity: O(α(n)) amortized
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        delta = self.pot[x] - self.pot[y] - w  # value(root_y) - value(root_x)
+        if root_x == root_y:
+            if delta != 0:
+                self.conflicts += 1
+                return False
+            return True
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y, delta = root_y, root_x, -delta
+        self.parent[root_y] = root_x
+        self.pot[root_y] = delta
+        self.size[root_x] += self.size[root_y]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def diff(self, x, y):
+        """
+        value(x) - value(y), or None if no chain of constraints links them.
+        """
+        if self.find(x) != self.find(y):
+            return None
+        return self.pot[x] - self.pot[y]
+
+
+class ParityDisjointSet:
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.parity = array('b', [0]) * n
+        self.count = n
+        self.conflicts = 0
+
+    def find(self, x):
+        """
+        Root of x; afterwards parity[x] is the parity of x relative to the root.
+        Time Complexity: O(α(n)) amortized
+        """
+        parent, parity = self.parent, self.parity
+        path = []
+        while parent[x] != x:
+            path.append(x)
+            x = parent[x]
+        for node in reversed(path):
+            if parent[node] != x:
+                parity[node] ^= parity[parent[node]]
+                parent[node] = x
+        return x
+
+    def union(self, x, y, odd=1):
+        """
+        Constrain x and y to differ (odd=1) or to be equal (odd=0).
+        Returns False on a conflict (odd cycle when used for bipartiteness).
+        Time Complexity: O(α(n)) amortized
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        flip = self.parity[x] ^ self.parity[y] ^ odd
+        if root_x == root_y:
+            if flip:
+                self.conflicts += 1
+                return False
+            return True
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.parity[root_y] = flip
+        self.size[root_x] += self.size[root_y]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def diff(self, x, y):
+        """
+        0 if x and y are on the same side, 1 if not, None if unrelated.
+        """
+        if self.find(x) != self.find(y):
+            return None
+        return self.parity[x] ^ self.parity[y]
+
+
 """
 APPLICATIONS
 
@@ -4,6 +4,9 @@ LINKED LIST
 
 
 class Node:
+    # no per-instance __dict__: ~56 bytes per node instead of ~150
+    __slots__ = ("value", "next")
+
     def __init__(self, value, next=None):
         self.value = value
         self.next = next
@@ -21,6 +24,14 @@ class Node:
         return self.value != other.value
 
 
+class DoublyNode(Node):
+    __slots__ = ("prev",)
+
+    def __init__(self, value, next=None, prev=None):
+        super().__init__(value, next)
+        self.prev = prev
+
+
 class SinglyLinkedList:
     def __init__(self):
         self.head = None
@@ -93,6 +104,8 @@ class SinglyLinkedList:
         if index == 0:
             new_node.next = self.head
             self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
         elif index == self.size:
             self.tail.next = new_node
             self.tail = new_node
@@ -113,9 +126,13 @@ class SinglyLinkedList:
             raise IndexError('Index out of range')
         if index == 0:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
         else:
             prev = self.get(index - 1)
             prev.next = prev.next.next
+            if prev.next is None:
+                self.tail = prev
         self.size -= 1
 
     def pop(self):
@@ -130,6 +147,8 @@ class SinglyLinkedList:
                     prev.next = current.next
                 else:
                     self.head = current.next
+                if current is self.tail:
+                    self.tail = prev
                 self.size -= 1
                 return True
             prev = current
@@ -144,7 +163,7 @@ class SinglyLinkedList:
             current.next = prev
             prev = current
             current = next_node
-        self.head = prev
+        self.head, self.tail = prev, self.head
 
     def copy(self):
         new_list = SinglyLinkedList()
@@ -246,7 +265,7 @@ class DoublyLinkedList:
     def insert(self, index, value):
         if index < 0 or index > self.size:
             raise IndexError('Index out of range')
-        new_node = Node(value)
+        new_node = DoublyNode(value)
         if index == 0:
             if self.head:
                 self.head.prev = new_node
@@ -295,6 +314,58 @@ class DoublyLinkedList:
     def pop(self):
         self.delete(self.size - 1)
 
+    def append_node(self, node):
+        """
+        Link an existing node at the tail.
+        Time Complexity: O(1)
+        """
+        node.prev = self.tail
+        node.next = None
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self.size += 1
+
+    def insert_node_after(self, ref, node):
+        """
+        Link an existing node right after ref (at the head if ref is None).
+        Time Complexity: O(1)
+        """
+        node.prev = ref
+        node.next = ref.next if ref else self.head
+        if node.next:
+            node.next.prev = node
+        else:
+            self.tail = node
+        if ref:
+            ref.next = node
+        else:
+            self.head = node
+        self.size += 1
+
+    def unlink(self, node):
+        """
+        Remove a node we already hold a reference to (e.g. from a hash map).
+        Time Complexity: O(1), vs O(n) for delete(index) / remove(value)
+        """
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+
+    def move_to_end(self, node):
+        if node is not self.tail:
+            self.unlink(node)
+            self.append_node(node)
+
     def remove(self, value):
         current = self.head
         while current:
@@ -0,0 +1,271 @@
+"""
+INDEXABLE SKIP LIST
+"""
+
+"""
+1. WHY?
+   - SinglyLinkedList.get / set / insert / delete walk from the head: O(n) per call
+   - `for i in range(len(ll)): ll[i]` is therefore O(n^2)
+
+2. SKIP LIST:
+   - Sorted-by-position linked list with extra "express lanes"
+   - Every node gets a random height (P(height >= k) = p^(k-1)), level 0 links every node
+   - Higher levels skip over many nodes -> O(log n) expected steps to reach any position
+
+3. SPANS (what makes it indexable):
+   - Each forward link also stores `span` = how many positions it jumps over
+   - Walking the top level down while pos + span <= target lands exactly on position target
+
+        level 2:  H ----------------5----------------> None
+        level 1:  H -----2------------------> 4 -----> None
+        level 0:  H -1-> A -1-> B -1-> C -1-> D -1-> E -1-> None
+                     (spans on top links: H->C = 3, H->B = 2, B->D = 2)
+
+   - Positions are 1-based internally (head sits at position 0)
+   - A link to None has span = size - pos + 1 (distance to a virtual tail), so the same
+     arithmetic works for the last node on every level
+
+4. TIME COMPLEXITIES (expected):
+   - get / set / insert / delete by index: O(log n)
+   - append / prepend: O(log n)
+   - search by value (index / remove / count): O(n), order is positional not sorted
+"""
+
+import random
+
+
+class SkipNode:
+    __slots__ = ("value", "next", "span")
+
+    def __init__(self, value, height):
+        self.value = value
+        self.next = [None] * height
+        self.span = [1] * height
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return str(self.value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+
+class SkipList:
+    """
+    Same API as SinglyLinkedList (get returns the node, iteration yields nodes),
+    with O(log n) positional operations.
+    """
+
+    MAX_LEVEL = 32
+    P = 0.5
+
+    def __init__(self, values=()):
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        for value in values:
+            self.append(value)
+
+    def __str__(self):
+        return str(self.to_list())
+
+    def __repr__(self):
+        return str(self.to_list())
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head.next[0]
+        while current:
+            yield current
+            current = current.next[0]
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def __setitem__(self, index, value):
+        self.set(index, value)
+
+    def __delitem__(self, index):
+        self.delete(index)
+
+    def __eq__(self, other):
+        if len(self) != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def to_list(self):
+        return [node.value for node in self]
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < self.P:
+            level += 1
+        return level
+
+    def _predecessors(self, target):
+        """
+        For every level, the last node with position <= target and its position.
+        Time Complexity: O(log n) expected
+        """
+        update = [None] * self.MAX_LEVEL
+        rank = [0] * self.MAX_LEVEL
+        node = self.head
+        pos = 0
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.span[lvl] <= target:
+                pos += node.span[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            rank[lvl] = pos
+        return update, rank
+
+    def get(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError('Index out of range')
+        node = self.head
+        pos = 0
+        target = index + 1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.span[lvl] <= target:
+                pos += node.span[lvl]
+                node = node.next[lvl]
+            if pos == target:
+                break
+        return node
+
+    def set(self, index, value):
+        self.get(index).value = value
+
+    def insert(self, index, value):
+        if index < 0 or index > self.size:
+            raise IndexError('Index out of range')
+        update, rank = self._predecessors(index)
+        height = self._random_level()
+        if height > self.level:
+            for lvl in range(self.level, height):
+                update[lvl] = self.head
+                rank[lvl] = 0
+                self.head.next[lvl] = None
+                self.head.span[lvl] = self.size + 1
+            self.level = height
+        node = SkipNode(value, height)
+        for lvl in range(height):
+            prev = update[lvl]
+            node.next[lvl] = prev.next[lvl]
+            prev.next[lvl] = node
+            # prev jumped span positions; node now sits (index - rank + 1) after prev
+            node.span[lvl] = prev.span[lvl] - (index - rank[lvl])
+            prev.span[lvl] = index - rank[lvl] + 1
+        for lvl in range(height, self.level):
+            update[lvl].span[lvl] += 1
+        self.size += 1
+
+    def append(self, value):
+        self.insert(self.size, value)
+
+    def prepend(self, value):
+        self.insert(0, value)
+
+    def delete(self, index):
+        if index < 0 or index >= self.size:
+            raise IndexError('Index out of range')
+        update, _ = self._predecessors(index)
+        node = update[0].next[0]
+        for lvl in range(self.level):
+            prev = update[lvl]
+            if prev.next[lvl] is node:
+                prev.span[lvl] += node.span[lvl] - 1
+                prev.next[lvl] = node.next[lvl]
+            else:
+                prev.span[lvl] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return node
+
+    def pop(self, index=None):
+        return self.delete(self.size - 1 if index is None else index).value
+
+    def remove(self, value):
+        for i, node in enumerate(self):
+            if node.value == value:
+                self.delete(i)
+                return True
+        return False
+
+    def reverse(self):
+        """
+        Time Complexity: O(n), the list is rebuilt
+        """
+        values = self.to_list()
+        self.clear()
+        for value in reversed(values):
+            self.append(value)
+
+    def copy(self):
+        return SkipList(self.to_list())
+
+    def clear(self):
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def count(self, value):
+        return sum(1 for node in self if node.value == value)
+
+    def index(self, value):
+        for i, node in enumerate(self):
+            if node.value == value:
+                return i
+        raise ValueError('Value not found')
+
+    def extend(self, other):
+        for node in other:
+            self.append(node.value)
+
+
+"""
+BENCHMARK: indexed access and middle insertions
+
+Run from repo root: python -m dsa.basics.skip_list [n]
+    SinglyLinkedList: O(n) per op -> O(n^2) total
+    list / deque: O(n) per middle insert but memmove fast
+    SkipList: O(log n) per op
+"""
+
+
+def benchmark(n=10**4):
+    import importlib
+    import time
+    from collections import deque
+
+    SinglyLinkedList = importlib.import_module("dsa.basics.linked-list").SinglyLinkedList
+
+    print(f"{'container':<18}{'middle insert (s)':>20}{'indexed loop (s)':>20}")
+    for name, factory in (("SinglyLinkedList", SinglyLinkedList), ("SkipList", SkipList),
+                          ("list", list), ("deque", deque)):
+        container = factory()
+        start = time.perf_counter()
+        for i in range(n):
+            container.insert(len(container) // 2, i)
+        insert_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(len(container)):
+            container[i]
+        loop_time = time.perf_counter() - start
+        print(f"{name:<18}{insert_time:>20.3f}{loop_time:>20.3f}")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**4)
@@ -93,3 +93,220 @@ When will sliding window not work?
 3: If given an invalid subarray it is hard to check whether adding or removing from only one end at a time would ever make it valid.
 
 """
+
+
+"""
+STREAMING SLIDING WINDOWS (GENERATORS)
+
+The templates above as reusable operators over any iterable, including unbounded
+generators: elements are read one at a time, only the current window is kept
+(a deque), results are yielded as they become available.
+
+    distinct_counts(it, k)           distinct values in every window of size k
+    valid_windows(it, add, remove, valid)
+                                     longest valid window ending at every position
+    longest_window(...)              the longest of those
+    count_at_most_k(it, k, weight)   running number of subarrays with measure <= k
+    count_exactly_k(it, k, weight)   atMost(k) - atMost(k - 1), one pass
+        measure = number of distinct values (weight=None) or sum of weight(x) >= 0
+
+NumPy fast path for fixed windows (whole arrays or a stream of chunks):
+    window_sums(a, k), window_distinct(a, k), chunked_windows(chunks, k, func)
+"""
+
+import collections
+import itertools
+
+import numpy as np
+
+
+def distinct_counts(iterable, k):
+    """
+    Time Complexity: O(1) per element, Space Complexity: O(k)
+    """
+    window = collections.deque()
+    counts = collections.Counter()
+    for x in iterable:
+        window.append(x)
+        counts[x] += 1
+        if len(window) > k:
+            old = window.popleft()
+            counts[old] -= 1
+            if not counts[old]:
+                del counts[old]
+        if len(window) == k:
+            yield len(counts)
+
+
+def valid_windows(iterable, add, remove, valid):
+    """
+    add(x) / remove(x) update the caller's window state, valid() checks it.
+    valid must be monotone: a valid window stays valid when shrunk from the left.
+    Yields (left, right) of the longest valid window ending at right
+    (left = right + 1 when even the empty window is invalid).
+    Time Complexity: O(1) amortized per element, Space Complexity: O(window)
+    """
+    window = collections.deque()
+    left = 0
+    for right, x in enumerate(iterable):
+        window.append(x)
+        add(x)
+        while window and not valid():
+            remove(window.popleft())
+            left += 1
+        yield left, right
+
+
+def longest_window(iterable, add, remove, valid):
+    """
+    (start, length) of the first longest valid window.
+    """
+    best = (0, 0)
+    for left, right in valid_windows(iterable, add, remove, valid):
+        if right - left + 1 > best[1]:
+            best = (left, right - left + 1)
+    return best
+
+
+def _measure(weight):
+    """
+    add / remove / value for "distinct values" or "sum of weights".
+    """
+    if weight is None:
+        counts = collections.Counter()
+
+        def add(x):
+            counts[x] += 1
+
+        def remove(x):
+            counts[x] -= 1
+            if not counts[x]:
+                del counts[x]
+        return add, remove, lambda: len(counts)
+
+    total = [0]
+
+    def add(x):
+        total[0] += weight(x)
+
+    def remove(x):
+        total[0] -= weight(x)
+    return add, remove, lambda: total[0]
+
+
+def count_at_most_k(iterable, k, weight=None):
+    """
+    Running number of subarrays (ending so far) whose measure is <= k:
+    every valid window [left, right] adds right - left + 1 subarrays.
+    Time Complexity: O(1) amortized per element
+    """
+    add, remove, value = _measure(weight)
+    total = 0
+    for left, right in valid_windows(iterable, add, remove, lambda: value() <= k):
+        total += right - left + 1
+        yield total
+
+
+def count_exactly_k(iterable, k, weight=None):
+    """
+    exactly(k) = atMost(k) - atMost(k - 1), both windows run in lockstep over one pass.
+    """
+    if k == 0:
+        yield from count_at_most_k(iterable, 0, weight)
+        return
+    first, second = itertools.tee(iterable)
+    for at_most, below in zip(count_at_most_k(first, k, weight), count_at_most_k(second, k - 1, weight)):
+        yield at_most - below
+
+
+def window_sums(a, k):
+    """
+    out[i] = sum(a[i:i + k]), empty if k > len(a).
+    Time Complexity: O(n)
+    """
+    a = np.asarray(a)
+    if k <= 0:
+        raise ValueError(f"Invalid window: {k}. Window must be positive")
+    prefix = np.concatenate(([0], np.cumsum(a)))
+    if k > len(a):
+        return prefix[:0]
+    return prefix[k:] - prefix[:-k]
+
+
+def window_distinct(a, k):
+    """
+    out[i] = number of distinct values in a[i:i + k].
+    Element j counts for window s iff its previous occurrence p is before s:
+    s in [max(p + 1, j - k + 1), min(j, n - k)] -> +1 on a difference array.
+    Time Complexity: O(n log n) (stable sort to find previous occurrences)
+    """
+    a = np.asarray(a)
+    n = len(a)
+    if k <= 0 or k > n:
+        raise ValueError(f"Invalid window: {k}. Valid range is [1, {n}]")
+    order = np.argsort(a, kind="stable")
+    previous = np.full(n, -1, dtype=np.int64)
+    same = a[order[1:]] == a[order[:-1]]
+    previous[order[1:][same]] = order[:-1][same]
+    j = np.arange(n)
+    start = np.maximum(previous + 1, j - k + 1)
+    stop = np.minimum(j, n - k) + 1
+    keep = start < stop
+    diff = np.zeros(n - k + 2, dtype=np.int64)
+    np.add.at(diff, start[keep], 1)
+    np.add.at(diff, stop[keep], -1)
+    return np.cumsum(diff)[:n - k + 1]
+
+
+def chunked_windows(chunks, k, func=window_sums):
+    """
+    Apply a fixed-window NumPy function to a stream of arrays as if they were one array:
+    the last k - 1 elements of each chunk are carried into the next one.
+    Yields one result array per chunk (windows that END in that chunk).
+    """
+    carry = None
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        data = chunk if carry is None else np.concatenate((carry, chunk))
+        if len(data) >= k:
+            yield func(data, k)
+        carry = data[max(0, len(data) - k + 1):]
+
+
+"""
+BENCHMARK: distinct count per window
+
+Run from repo root: python -m dsa.basics.sliding_window [n]
+"""
+
+
+def benchmark(n=10**6, k=1000, seed=0):
+    import time
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 5000, size=n)
+
+    start = time.perf_counter()
+    stream = sum(1 for _ in distinct_counts(iter(a.tolist()), k))
+    stream_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector = sum(len(out) for out in chunked_windows(np.array_split(a, 16), k, window_distinct))
+    vector_time = time.perf_counter() - start
+    assert stream == vector
+
+    sample = min(n - k + 1, 2000)
+    start = time.perf_counter()
+    for i in range(sample):
+        len(set(a[i:i + k].tolist()))
+    naive_time = (time.perf_counter() - start) * (n - k + 1) / sample
+
+    print(f"n = {n}, k = {k}")
+    print(f"{'distinct_counts (generator)':<30}{stream_time:>10.2f} s")
+    print(f"{'window_distinct (16 chunks)':<30}{vector_time:>10.2f} s")
+    print(f"{'len(set(window)) per window':<30}{naive_time:>10.2f} s (extrapolated)")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
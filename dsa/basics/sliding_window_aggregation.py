@@ -0,0 +1,298 @@
+"""
+SLIDING WINDOW AGGREGATION (SWAG)
+"""
+
+"""
+A FIFO window with push (newest), pop (oldest) and aggregate() = v1 ⊗ v2 ⊗ ... ⊗ vn
+for ANY associative ⊗: sum, product, gcd, min / max, matrix product, histogram merge...
+No inverse needed (unlike a running sum, which subtracts what leaves the window),
+no commutativity needed (order is preserved).
+
+1. TWO STACKS (MinStack idea, generalized)
+   - MinStack keeps (value, min of everything below) per entry
+   - same with ⊗, but the two stacks aggregate in opposite directions:
+        back  (push side): (value, back[-2].agg ⊗ value)    -> agg of back, oldest..newest
+        front (pop side):  (value, value ⊗ front[-2].agg)   -> agg from this entry to the
+                                                             newest entry of front
+   - aggregate() = front[-1].agg ⊗ back[-1].agg
+   - pop on an empty front: FLIP, move all of back to front recomputing aggs -> O(n) once,
+     every element flips at most once -> O(1) amortized, but one pop can cost O(n)
+
+2. DABA LITE (De-Amortized Banker's Aggregator, Tangwongsan, Hirzel, Schneider)
+   - one deque split by pointers F <= L <= R <= A <= B <= E:
+        [F, L)  front, finished      agg[i] = v[i..B)
+        [L, R)  front, in progress   agg[i] = v[i..R)
+        [R, A)  old back, values only
+        [A, B)  old back, finished   agg[i] = v[i..B)
+        [B, E)  back, values only    + one scalar agg_b = v[B..E)
+     and a scalar agg_ra = v[R..B)
+   - instead of flipping all at once, fixup() after every push / pop does ONE step:
+        flip   (L == B): the whole front is "finished" -> it becomes [L, R), the back
+               becomes [R, A); starts only when |front| == |back|
+        shrink (L != R): agg[L] ⊗= agg_ra (L joins the finished front),
+                         agg[A - 1] = v[A - 1] ⊗ agg[A] (A - 1 joins the finished back)
+        shift  (L == R): the in-progress parts are done, move L, R, A one to the right
+   - aggregate() = agg[F] ⊗ agg_b
+   - every operation: at most 2 ⊗ + O(1) bookkeeping, WORST CASE
+   - storage is a ring buffer; growing it is the only O(n) step, pass `capacity` to avoid it
+
+        push / pop / aggregate: O(1) amortized (two stacks), O(1) worst case (DABA lite)
+"""
+
+import collections
+import time
+
+_EMPTY = object()  # stands in for the identity of operators that have none (min, max)
+
+
+def _with_identity(op, identity):
+    """
+    Returns (combine, identity); without an identity, _EMPTY acts as one.
+    """
+    if identity is not _EMPTY:
+        return op, identity
+
+    def combine(a, b):
+        if a is _EMPTY:
+            return b
+        if b is _EMPTY:
+            return a
+        return op(a, b)
+    return combine, _EMPTY
+
+
+class TwoStackAggregator:
+
+    def __init__(self, op, identity=_EMPTY):
+        self.op, self.identity = _with_identity(op, identity)
+        self.front = []  # (value, agg), top = oldest
+        self.back = []   # (value, agg), top = newest
+
+    def __len__(self):
+        return len(self.front) + len(self.back)
+
+    def push(self, value):
+        """
+        Time Complexity: O(1)
+        """
+        if self.back:
+            self.back.append((value, self.op(self.back[-1][1], value)))
+        else:
+            self.back.append((value, value))
+
+    def _flip(self):
+        op, front, back = self.op, self.front, self.back
+        while back:
+            value = back.pop()[0]
+            front.append((value, op(value, front[-1][1]) if front else value))
+
+    def pop(self):
+        """
+        Remove and return the oldest value.
+        Time Complexity: O(1) amortized, O(n) when the front stack is refilled
+        """
+        if not self.front:
+            if not self.back:
+                raise IndexError('Queue is empty')
+            self._flip()
+        return self.front.pop()[0]
+
+    def front_value(self):
+        if self.front:
+            return self.front[-1][0]
+        if self.back:
+            return self.back[0][0]
+        raise IndexError('Queue is empty')
+
+    def aggregate(self):
+        """
+        Time Complexity: O(1)
+        """
+        if not self.front and not self.back:
+            if self.identity is _EMPTY:
+                raise IndexError('Queue is empty')
+            return self.identity
+        if not self.front:
+            return self.back[-1][1]
+        if not self.back:
+            return self.front[-1][1]
+        return self.op(self.front[-1][1], self.back[-1][1])
+
+
+class DABALiteAggregator:
+
+    def __init__(self, op, identity=_EMPTY, capacity=16):
+        self.op, self.identity = _with_identity(op, identity)
+        self.capacity = capacity
+        self.vals = [None] * capacity
+        self.aggs = [None] * capacity
+        # absolute positions, slot = position % capacity
+        self.F = self.L = self.R = self.A = self.B = self.E = 0
+        self.agg_ra = self.identity
+        self.agg_b = self.identity
+
+    def __len__(self):
+        return self.E - self.F
+
+    def _agg(self, i, stop):
+        """
+        aggs[i], or the identity if the range [i, stop) is empty.
+        """
+        return self.aggs[i % self.capacity] if i != stop else self.identity
+
+    def _grow(self):
+        old, cap = self.capacity, self.capacity * 2
+        vals, aggs = [None] * cap, [None] * cap
+        for i in range(self.F, self.E):
+            vals[i % cap] = self.vals[i % old]
+            aggs[i % cap] = self.aggs[i % old]
+        self.vals, self.aggs, self.capacity = vals, aggs, cap
+
+    def push(self, value):
+        """
+        Time Complexity: O(1) worst case (ring buffer growth aside)
+        """
+        if self.E - self.F == self.capacity:
+            self._grow()
+        slot = self.E % self.capacity
+        self.vals[slot] = value
+        self.aggs[slot] = value
+        self.agg_b = self.op(self.agg_b, value)
+        self.E += 1
+        self._fixup()
+
+    def pop(self):
+        """
+        Remove and return the oldest value.
+        Time Complexity: O(1) worst case
+        """
+        if self.F == self.E:
+            raise IndexError('Queue is empty')
+        slot = self.F % self.capacity
+        value = self.vals[slot]
+        self.vals[slot] = self.aggs[slot] = None  # drop references
+        self.F += 1
+        self._fixup()
+        return value
+
+    def front_value(self):
+        if self.F == self.E:
+            raise IndexError('Queue is empty')
+        return self.vals[self.F % self.capacity]
+
+    def _fixup(self):
+        op, cap = self.op, self.capacity
+        if self.F == self.B:
+            # front is empty: the (at most one element) back becomes the front
+            self.L = self.R = self.A = self.B = self.E
+            self.agg_ra = self.agg_b = self.identity
+            return
+        if self.L == self.B:
+            # flip: finished front -> in-progress front, back -> old back
+            self.L = self.F
+            self.A = self.B = self.E
+            self.agg_ra, self.agg_b = self.agg_b, self.identity
+        if self.L == self.R:
+            # shift
+            self.L += 1
+            self.R += 1
+            self.A += 1
+            self.agg_ra = self._agg(self.A, self.B)
+        else:
+            # shrink
+            slot = self.L % cap
+            self.aggs[slot] = op(self.aggs[slot], self.agg_ra)
+            self.L += 1
+            slot = (self.A - 1) % cap
+            self.aggs[slot] = op(self.vals[slot], self._agg(self.A, self.B))
+            self.A -= 1
+
+    def aggregate(self):
+        """
+        Time Complexity: O(1) worst case
+        """
+        if self.F == self.E:
+            if self.identity is _EMPTY:
+                raise IndexError('Queue is empty')
+            return self.identity
+        return self.op(self._agg(self.F, self.B), self.agg_b)
+
+
+class SlidingWindowAggregator:
+    """
+    Fixed-size window (last k values) on top of either queue.
+    """
+
+    def __init__(self, k, op, identity=_EMPTY, worst_case=False):
+        if k <= 0:
+            raise ValueError("Window must be positive")
+        self.k = k
+        if worst_case:
+            # k + 1 slots: push happens before the pop, so the ring never has to grow
+            self.queue = DABALiteAggregator(op, identity, capacity=k + 1)
+        else:
+            self.queue = TwoStackAggregator(op, identity)
+
+    def push(self, value):
+        """
+        Add value, evict the oldest one if the window is full, return the window aggregate.
+        """
+        self.queue.push(value)
+        if len(self.queue) > self.k:
+            self.queue.pop()
+        return self.queue.aggregate()
+
+
+"""
+BENCHMARK: window aggregate over a stream (window k, n pushes)
+
+Run from repo root: python -m dsa.basics.sliding_window_aggregation [n]
+    naive: reduce over the whole window per push -> O(n k)
+    TwoStack: fast on average, one push in every ~k pays for a whole flip
+    DABA lite: slightly more work per push, but no spikes -> compare max latency
+"""
+
+
+def benchmark(n=10**6, k=10**4):
+    import functools
+    import math
+    import operator
+
+    def matmul(a, b):  # 2x2 matrices as tuples, associative, not commutative
+        return (a[0] * b[0] + a[1] * b[2], a[0] * b[1] + a[1] * b[3],
+                a[2] * b[0] + a[3] * b[2], a[2] * b[1] + a[3] * b[3])
+
+    operators = (
+        ("sum", operator.add, 0, lambda i: i),
+        ("gcd", math.gcd, 0, lambda i: (i * 7919) % 10**6),
+        ("2x2 matmul mod", lambda a, b: tuple(x % 1000003 for x in matmul(a, b)),
+         (1, 0, 0, 1), lambda i: (i % 7, 1, 1, 0)),
+        ("max (no identity)", max, _EMPTY, lambda i: (i * 7919) % 10**6),
+    )
+    print(f"n = {n}, k = {k}")
+    print(f"{'operator':<20}{'queue':<12}{'total (s)':>12}{'max push (ms)':>16}")
+    for name, op, identity, gen in operators:
+        values = [gen(i) for i in range(n)]
+        for label, worst_case in (("TwoStack", False), ("DABA lite", True)):
+            window = SlidingWindowAggregator(k, op, identity, worst_case)
+            worst = 0.0
+            start = time.perf_counter()
+            for value in values:
+                t = time.perf_counter()
+                window.push(value)
+                worst = max(worst, time.perf_counter() - t)
+            total = time.perf_counter() - start
+            print(f"{name:<20}{label:<12}{total:>12.2f}{worst * 1e3:>16.3f}")
+        sample = min(n, 2000)
+        window = collections.deque(maxlen=k)
+        start = time.perf_counter()
+        for value in values[:sample]:
+            window.append(value)
+            functools.reduce(op, window)
+        print(f"{name:<20}{'naive':<12}{(time.perf_counter() - start) * n / sample:>12.2f}"
+              f"{'':>16}  (extrapolated)")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
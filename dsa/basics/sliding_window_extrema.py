@@ -0,0 +1,195 @@
+"""
+SLIDING WINDOW MIN / MAX
+"""
+
+"""
+1. STREAMING: two monotonic deques (see MinQueue in stack-queue.py)
+   - min deque: values increasing from front to back, front = window min
+   - max deque: values decreasing from front to back, front = window max
+   - entries are (key, value), key = position (fixed-size window) or timestamp
+   - push: drop back entries that can never be the answer again, append
+   - expire: drop front entries whose key left the window
+        fixed size k:   key <= position - k
+        duration d:     key <= ts - d        -> window is (ts - d, ts]
+   - every value enters and leaves each deque once: O(1) amortized per push
+
+2. ARRAYS (NumPy): van Herk / Gil-Werman
+   - cut the array into blocks of k
+        prefix[i] = min of block start .. i     (np.minimum.accumulate per row)
+        suffix[i] = min of i .. block end        (same on the reversed rows)
+   - window [i, i + k - 1] spans at most two blocks:
+        min = minimum(suffix[i], prefix[i + k - 1])
+   - 3 vectorized passes, independent of k, no Python loop per element
+   - long arrays are processed in chunks overlapping by k - 1 to bound temporary memory
+
+        streaming push: O(1) amortized     window_min / window_max: O(n)
+"""
+
+import collections
+
+import numpy as np
+
+
+class SlidingWindowExtrema:
+    """
+    Window min and max of a stream, by count (size=k) or by time (duration=d).
+    """
+
+    def __init__(self, size=None, duration=None):
+        if (size is None) == (duration is None):
+            raise ValueError("Exactly one of size or duration is required")
+        if (size is not None and size <= 0) or (duration is not None and duration <= 0):
+            raise ValueError("Window must be positive")
+        self.size = size
+        self.duration = duration
+        self.position = 0  # number of values pushed so far
+        self.min_deque = collections.deque()
+        self.max_deque = collections.deque()
+
+    def push(self, value, ts=None):
+        """
+        Add value (with timestamp ts for time windows, non-decreasing), expire old ones.
+        Returns (window min, window max).
+        Time Complexity: O(1) amortized
+        """
+        if self.duration is not None:
+            if ts is None:
+                raise ValueError("Time-based window needs a timestamp")
+            key, oldest = ts, ts - self.duration
+        else:
+            key, oldest = self.position, self.position - self.size
+        self.position += 1
+
+        min_deque, max_deque = self.min_deque, self.max_deque
+        while min_deque and min_deque[-1][1] >= value:
+            min_deque.pop()
+        min_deque.append((key, value))
+        while max_deque and max_deque[-1][1] <= value:
+            max_deque.pop()
+        max_deque.append((key, value))
+
+        while min_deque[0][0] <= oldest:
+            min_deque.popleft()
+        while max_deque[0][0] <= oldest:
+            max_deque.popleft()
+        return min_deque[0][1], max_deque[0][1]
+
+    def expire(self, ts):
+        """
+        Time windows only: advance the clock without a new value.
+        """
+        if self.duration is None:
+            raise ValueError("Only time-based windows expire by timestamp")
+        oldest = ts - self.duration
+        while self.min_deque and self.min_deque[0][0] <= oldest:
+            self.min_deque.popleft()
+        while self.max_deque and self.max_deque[0][0] <= oldest:
+            self.max_deque.popleft()
+
+    def min(self):
+        if not self.min_deque:
+            raise IndexError('Window is empty')
+        return self.min_deque[0][1]
+
+    def max(self):
+        if not self.max_deque:
+            raise IndexError('Window is empty')
+        return self.max_deque[0][1]
+
+    def extrema(self):
+        return self.min(), self.max()
+
+
+def _block_extremum(a, k, ufunc):
+    """
+    van Herk / Gil-Werman on one chunk, returns len(a) - k + 1 values.
+    """
+    n = len(a)
+    blocks = -(-n // k)
+    padded = np.empty(blocks * k, dtype=a.dtype)
+    padded[:n] = a
+    padded[n:] = a[-1]  # repeating the last value never changes a min / max
+    rows = padded.reshape(blocks, k)
+    prefix = ufunc.accumulate(rows, axis=1).ravel()
+    suffix = ufunc.accumulate(rows[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[:n - k + 1], prefix[k - 1:n])
+
+
+def _window_extremum(a, k, ufunc, chunk_size):
+    a = np.asarray(a)
+    if a.ndim != 1:
+        raise ValueError("Expected a 1-D array")
+    if k <= 0 or k > len(a):
+        raise ValueError(f"Invalid window: {k}. Valid range is [1, {len(a)}]")
+    if k == 1:
+        return a.copy()
+    out = np.empty(len(a) - k + 1, dtype=a.dtype)
+    step = max(chunk_size, k)  # windows produced per chunk
+    for start in range(0, len(out), step):
+        stop = min(start + step, len(out))
+        out[start:stop] = _block_extremum(a[start:stop + k - 1], k, ufunc)
+    return out
+
+
+def window_min(a, k, chunk_size=1 << 22):
+    """
+    out[i] = min(a[i:i + k]) for i in 0..len(a) - k.
+    Time Complexity: O(n), Space Complexity: O(n) output + O(chunk_size + k) temporaries
+    """
+    return _window_extremum(a, k, np.minimum, chunk_size)
+
+
+def window_max(a, k, chunk_size=1 << 22):
+    """
+    out[i] = max(a[i:i + k]) for i in 0..len(a) - k.
+    Time Complexity: O(n)
+    """
+    return _window_extremum(a, k, np.maximum, chunk_size)
+
+
+"""
+BENCHMARK: window min + max over n samples
+
+Run from repo root: python -m dsa.basics.sliding_window_extrema [n]
+    NumPy path runs on all n samples (float64, 8 bytes each)
+    the streaming deque runs on a 10^6 sample and is extrapolated
+    sliding_window_view(...).min(axis=1) is O(n k), shown for comparison
+"""
+
+
+def benchmark(n=10**8, k=1000, seed=0):
+    import time
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    rng = np.random.default_rng(seed)
+    a = rng.standard_normal(n)
+
+    start = time.perf_counter()
+    lo = window_min(a, k)
+    hi = window_max(a, k)
+    numpy_time = time.perf_counter() - start
+
+    sample = min(n, 10**6)
+    window = SlidingWindowExtrema(size=k)
+    values = a[:sample].tolist()
+    start = time.perf_counter()
+    for value in values:
+        window.push(value)
+    stream_time = (time.perf_counter() - start) * n / sample
+    assert window.extrema() == (lo[sample - k], hi[sample - k])
+
+    naive_sample = min(n, 10**6)
+    start = time.perf_counter()
+    view = sliding_window_view(a[:naive_sample], k)
+    view.min(axis=1), view.max(axis=1)
+    naive_time = (time.perf_counter() - start) * n / naive_sample
+
+    print(f"n = {n}, k = {k}")
+    print(f"{'window_min + window_max':<28}{numpy_time:>10.2f} s")
+    print(f"{'SlidingWindowExtrema.push':<28}{stream_time:>10.2f} s (extrapolated)")
+    print(f"{'sliding_window_view O(nk)':<28}{naive_time:>10.2f} s (extrapolated)")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**8)
@@ -12,6 +12,9 @@ increasing monotonic queue -
     because the last element in the queue will never be the maximum element in the window
     2) if the current element is less than the last element in the queue, then we can append the current element to the queue,
     because the current element may be the maximum element in the window
+
+Index-returning NSE / PSE / NGE / PGE without a Python loop per element,
+largest rectangle in histogram, sum of subarray minimums: see monotonic_stack.py
 """
 import collections
 
@@ -54,6 +57,8 @@ def decreasing_queue(A):
 """
 MIN STACK
 - single stack to store the elements and the minimum element
+- works for any associative operator, two of these make a queue:
+  see sliding_window_aggregation.py
 """
 
 class MinStack:
@@ -76,6 +81,9 @@ MIN QUEUE
 
 - Increasing Monotonic Queue
 - so front would have min (remove from front, add at back)
+- pop(val): val is the element leaving the window, the front only goes if it IS that element
+  (equal values are all kept by push, so duplicates are handled)
+- min and max together, time-based windows, NumPy arrays: see sliding_window_extrema.py
 """
 
 class MinQueue:
@@ -85,8 +93,8 @@ class MinQueue:
         while self.deque and self.deque[-1] > val:
             self.deque.pop()
         self.deque.append(val)
-    def pop(self):
-        if self.deque[0] == 0:
+    def pop(self, val):
+        if self.deque and self.deque[0] == val:
             self.deque.popleft()
     def getMin(self):
         return self.deque[0]
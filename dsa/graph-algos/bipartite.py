@@ -37,6 +37,8 @@ colored using only two colors such that no two adjacent vertices have the same c
 
 from collections import deque
 
+from dsa.basics.disjoint_set import ParityDisjointSet
+
 def is_bipartite(graph):
     """
     Check if a graph is bipartite using BFS with 2-coloring.
@@ -94,6 +96,55 @@ def is_bipartite_dfs(graph):
     return True
 
 
+class OnlineBipartite:
+    """
+    Bipartiteness while edges keep arriving (graph ingestion).
+
+    Re-running is_bipartite after every edge costs O(V + E) per edge.
+    A ParityDisjointSet answers each new edge in O(α(n)):
+        - union(u, v, odd=1): u and v must get different colors
+        - a conflict means the edge closes an odd cycle
+    Once an odd cycle exists the graph can never become bipartite again
+    (edges are only added), the rejected edge is still counted.
+    """
+
+    def __init__(self, n):
+        self.ds = ParityDisjointSet(n)
+        self.bipartite = True
+        self.first_conflict = None  # first edge that closed an odd cycle
+
+    def add_edge(self, u, v):
+        """
+        Returns whether the graph is still bipartite.
+        Time Complexity: O(α(n)) amortized
+        """
+        if not self.ds.union(u, v, 1) and self.bipartite:
+            self.bipartite = False
+            self.first_conflict = (u, v)
+        return self.bipartite
+
+    def same_side(self, u, v):
+        """
+        True / False if u and v are connected (colors are forced), None otherwise.
+        """
+        diff = self.ds.diff(u, v)
+        return None if diff is None else diff == 0
+
+    def coloring(self):
+        """
+        A valid 2-coloring (parity relative to each component root).
+        Time Complexity: O(V α(V))
+        """
+        if not self.bipartite:
+            return None
+        ds = self.ds
+        colors = []
+        for x in range(len(ds.parent)):
+            ds.find(x)
+            colors.append(ds.parity[x])
+        return colors
+
+
 """
 APPLICATIONS
 
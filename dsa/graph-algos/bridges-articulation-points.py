@@ -23,6 +23,115 @@ that help identify vulnerable points in network connectivity.
    - A graph without articulation points is called biconnected
 """
 
+import importlib
+from array import array
+
+import numpy as np
+
+CSRGraph = importlib.import_module("dsa.graph-algos.csr-graph").CSRGraph
+
+
+"""
+LOW-LINK, ITERATIVE
+
+DFS gives every vertex
+    tin[v]: discovery time
+    low[v]: smallest tin reachable from v's subtree with one back edge
+For a tree edge u -> v (v child of u):
+    low[v] >  tin[u]  ->  u-v is a bridge (nothing below v climbs back to u or above)
+    low[v] >= tin[u]  ->  u is an articulation point (u not the root)
+    the root is an articulation point iff it has > 1 DFS children
+
+No recursion: the DFS path is an array and edge[v] is the next CSR position to scan in
+v's adjacency. The parent edge is skipped ONCE per vertex, so a parallel edge to the
+parent still counts as a back edge (two parallel edges are never a bridge).
+
+2-edge-connected components fall out of the same DFS: keep a stack of visited vertices,
+when u-v is a bridge pop down to v -> one component. Contracting them (condensation in
+scc.py) gives the bridge tree.
+"""
+
+
+def low_link(graph, n=None):
+    """
+    Undirected graph (every edge stored in both directions), CSRGraph or adjacency lists.
+    Returns (bridges, is_articulation, comp):
+        bridges:          (k, 2) array of tree edges (parent, child)
+        is_articulation:  bool array
+        comp:             2-edge-connected component id per vertex
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph, n)
+    n = graph.n
+    ptr, idx = graph._ptr, graph._idx
+    tin = array('i', [-1]) * n
+    low = array('i', [0]) * n
+    parent = array('i', [-1]) * n
+    skipped = bytearray(n)
+    is_articulation = bytearray(n)
+    comp = array('i', [-1]) * n
+    edge = array('q', graph.indptr[:-1].tobytes())
+    bridges = array('i')
+    stack = array('i')
+    path = array('i')
+    timer = count = 0
+
+    for root in range(n):
+        if tin[root] != -1:
+            continue
+        tin[root] = low[root] = timer
+        timer += 1
+        path.append(root)
+        stack.append(root)
+        root_children = 0
+        while path:
+            v = path[-1]
+            e = edge[v]
+            if e < ptr[v + 1]:
+                edge[v] = e + 1
+                w = idx[e]
+                if w == parent[v] and not skipped[v]:
+                    skipped[v] = 1
+                elif tin[w] == -1:
+                    parent[w] = v
+                    tin[w] = low[w] = timer
+                    timer += 1
+                    path.append(w)
+                    stack.append(w)
+                    if v == root:
+                        root_children += 1
+                elif tin[w] < low[v]:
+                    low[v] = tin[w]
+                continue
+            path.pop()
+            if not path:
+                break
+            u = path[-1]
+            if low[v] < low[u]:
+                low[u] = low[v]
+            if low[v] > tin[u]:
+                bridges.append(u)
+                bridges.append(v)
+                while True:
+                    w = stack.pop()
+                    comp[w] = count
+                    if w == v:
+                        break
+                count += 1
+            if low[v] >= tin[u] and u != root:
+                is_articulation[u] = 1
+        while stack:
+            comp[stack.pop()] = count
+        count += 1
+        if root_children > 1:
+            is_articulation[root] = 1
+    return (np.frombuffer(bridges, dtype=np.int32).reshape(-1, 2),
+            np.frombuffer(is_articulation, dtype=np.bool_),
+            np.frombuffer(comp, dtype=np.int32))
+
+
 def find_articulation_points(graph):
     """
     Find only articulation points using Tarjan's algorithm.
@@ -30,33 +139,8 @@ def find_articulation_points(graph):
     Time Complexity: O(V + E)
     Space Complexity: O(V)
     """
-    n = len(graph)
-    time = [(-1, -1)] * n
-    ap = set()
-    t = 0
-    
-    def dfs(node, parent=None):
-        time[node] = (t, t)
-        t += 1
-        children = 0
-        for nei in graph[node]:
-            if time[nei][0] == -1:
-                children += 1
-                dfs(nei, node)
-                time[node] = (time[node][0], min(time[node][1], time[nei][1]))
-                if parent is not None and time[nei][1] >= time[node][0]:
-                    ap.add(node)
-            elif nei != parent:
-                time[node] = (time[node][0], min(time[node][1], time[nei][0]))
-                
-        if parent is None and children > 1:
-            ap.add(node)
-    
-    for i in range(n):
-        if time[i][0] == -1:
-            dfs(i)
-    
-    return list(articulation_points)
+    _, is_articulation, _ = low_link(graph, len(graph))
+    return np.flatnonzero(is_articulation).tolist()
 
 
 def find_bridges(graph):
@@ -71,23 +155,5 @@ def find_bridges(graph):
     Time Complexity: O(V + E)
     Space Complexity: O(V)
     """
-    n = len(graph)
-    time = [(-1, -1)] * n
-    bridges = []
-    t = 0
-    
-    def dfs(node, parent=None):
-        time[node] = (t, t)
-        for nei in graph[node]:
-            if time[nei][0] == -1:
-                dfs(nei, node)
-                time[node] = (time[node][0], min(time[node][1], time[nei][1]))
-                if time[nei][1] > time[node][0]:
-                    bridges.append((node, nei))
-            elif nei != parent:  # Back edge
-                time[node] = (time[node][0], min(time[node][1], time[nei][0]))
-    
-    for i in range(n):
-        if time[i][0] == -1:
-            dfs(i)
-    return bridges
+    bridges, _, _ = low_link(graph, len(graph))
+    return [tuple(edge) for edge in bridges.tolist()]
@@ -0,0 +1,302 @@
+"""
+GRAPH: CSR (COMPRESSED SPARSE ROW) REPRESENTATION
+"""
+
+"""
+Adjacency lists (list of lists / dict, see GraphDict in graph-traversal.py) cost one Python
+object per edge: ~28 bytes per int + 8 per list slot (+ a tuple for (nei, w) pairs).
+10^7 edges -> GBs, and every traversal chases pointers.
+
+CSR = three flat arrays, all edges of a node are contiguous:
+    indptr   (n + 1)  out-edges of u are positions indptr[u] .. indptr[u + 1] - 1
+    indices  (E)      target of each edge           int32 -> 4 bytes
+    weights  (E)      weight of each edge, optional float64 -> 8 bytes
+
+    edges: 0->1 (5), 0->2 (3), 2->1 (1)
+        indptr  = [0, 2, 2, 3]
+        indices = [1, 2, 1]
+        weights = [5, 3, 1]
+
+- building: sort edges by source (counting sort: bincount + cumsum) -> O(V + E)
+- reverse graph: the same build with (target, source) pairs
+- graph[u] behaves like an adjacency list entry (neighbors, or (neighbor, weight) pairs),
+  backed by zero-copy memoryview slices, so the list-based functions in this directory
+  accept a CSRGraph directly; the hot ones (BFS, Dijkstra, Kruskal, Kahn) read the
+  arrays without building Python lists
+- graph[u] changes shape with the weights, so functions that need one shape use
+  neighbor_ids(graph) / weighted_neighbors(graph): ids only, or (v, w) pairs with
+  weight 1 on an unweighted graph, for a CSRGraph and adjacency lists alike
+- n nodes are 0..n-1
+"""
+
+import numpy as np
+
+
+def neighbor_ids(graph):
+    """
+    u -> neighbor ids of u; graph is a CSRGraph (weighted or not) or adjacency lists of ids.
+    """
+    return graph.targets if isinstance(graph, CSRGraph) else graph.__getitem__
+
+
+def weighted_neighbors(graph):
+    """
+    u -> (v, w) pairs of u; graph is a CSRGraph (unweighted: w = 1) or adjacency lists of pairs.
+    """
+    return graph.weighted if isinstance(graph, CSRGraph) else graph.__getitem__
+
+
+class CSRGraph:
+
+    def __init__(self, indptr, indices, weights=None):
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int32)
+        self.weights = None if weights is None else np.ascontiguousarray(weights, dtype=np.float64)
+        self.n = len(self.indptr) - 1
+        if self.indptr[-1] != len(self.indices):
+            raise ValueError(f"indptr ends at {self.indptr[-1]}, expected {len(self.indices)}")
+        # memoryviews: slicing is zero-copy and iterating yields plain Python numbers
+        self._ptr = memoryview(self.indptr)
+        self._idx = memoryview(self.indices)
+        self._w = None if self.weights is None else memoryview(self.weights)
+
+    # --- construction -----------------------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, n, us, vs, weights=None, directed=True):
+        """
+        Time Complexity: O(V + E log E) (stable argsort on the sources)
+        """
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            us, vs = np.concatenate((us, vs)), np.concatenate((vs, us))
+            if weights is not None:
+                weights = np.concatenate((weights, weights))
+        if len(us) and (min(us.min(), vs.min()) < 0 or max(us.max(), vs.max()) >= n):
+            raise ValueError(f"Node ids must be in [0, {n - 1}]")
+        order = np.argsort(us, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(us, minlength=n), out=indptr[1:])
+        return cls(indptr, vs[order], None if weights is None else weights[order])
+
+    @classmethod
+    def from_edge_list(cls, n, edges, directed=True):
+        """
+        edges: iterable of (u, v) or (u, v, w)
+        """
+        edges = list(edges)
+        if not edges:
+            return cls(np.zeros(n + 1), [])
+        edges = np.asarray(edges, dtype=np.float64 if len(edges[0]) == 3 else np.int64)
+        weights = edges[:, 2] if edges.shape[1] == 3 else None
+        return cls.from_edges(n, edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64),
+                              weights, directed)
+
+    @classmethod
+    def from_adjacency(cls, graph, n=None):
+        """
+        List of lists / dict / GraphDict: graph[u] = [v, ...] or [(v, w), ...].
+        """
+        graph = getattr(graph, "graph", graph)  # GraphDict keeps its dict in .graph
+        items = graph.items() if isinstance(graph, dict) else enumerate(graph)
+        us, vs, ws = [], [], []
+        for u, neighbors in items:
+            for entry in neighbors:
+                if isinstance(entry, tuple):
+                    v, w = entry
+                    ws.append(w)
+                else:
+                    v = entry
+                us.append(u)
+                vs.append(v)
+        if n is None:
+            n = max(max(us, default=-1), max(vs, default=-1), len(graph) - 1) + 1
+        if ws and len(ws) != len(us):
+            raise ValueError("Mixed weighted and unweighted entries")
+        return cls.from_edges(n, us, vs, ws or None)
+
+    @classmethod
+    def from_matrix(cls, matrix, weighted=False):
+        """
+        Adjacency matrix (list of lists, ndarray or GraphMatrix), nonzero entry = edge.
+        weighted=True keeps the entries as weights.
+        Time Complexity: O(V^2)
+        """
+        matrix = np.asarray(getattr(matrix, "matrix", matrix))
+        us, vs = np.nonzero(matrix)
+        return cls.from_edges(len(matrix), us, vs, matrix[us, vs] if weighted else None)
+
+    def reverse(self):
+        """
+        Every edge u -> v becomes v -> u.
+        Time Complexity: O(V + E log E)
+        """
+        us, vs, ws = self.to_edges()
+        return CSRGraph.from_edges(self.n, vs, us, ws)
+
+    def to_edges(self):
+        """
+        (sources, targets, weights or None) as arrays, grouped by source.
+        """
+        sources = np.repeat(np.arange(self.n), np.diff(self.indptr))
+        return sources, self.indices, self.weights
+
+    # --- adjacency-list interface ------------------------------------------------------
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, u):
+        """
+        Neighbors of u, or (neighbor, weight) pairs for a weighted graph.
+        """
+        start, stop = self._ptr[u], self._ptr[u + 1]
+        if self._w is None:
+            return self._idx[start:stop]
+        return zip(self._idx[start:stop], self._w[start:stop])
+
+    def neighbors(self, u):
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def targets(self, u):
+        """
+        Neighbor ids of u, also for a weighted graph (zero-copy memoryview slice).
+        """
+        return self._idx[self._ptr[u]:self._ptr[u + 1]]
+
+    def weighted(self, u):
+        """
+        (neighbor, weight) pairs of u, weight 1.0 for an unweighted graph.
+        """
+        start, stop = self._ptr[u], self._ptr[u + 1]
+        if self._w is None:
+            return ((v, 1.0) for v in self._idx[start:stop])
+        return zip(self._idx[start:stop], self._w[start:stop])
+
+    def edge_weights(self):
+        """
+        Weight of every edge (to_edges order), ones for an unweighted graph.
+        """
+        return np.ones(len(self.indices)) if self.weights is None else self.weights
+
+    def out_degree(self, u=None):
+        degrees = np.diff(self.indptr)
+        return degrees if u is None else int(degrees[u])
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + (0 if self.weights is None else self.weights.nbytes)
+
+    # --- vectorized traversal ----------------------------------------------------------
+
+    def _expand(self, frontier):
+        """
+        All out-neighbors of the frontier nodes, one gather.
+        """
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.int32)
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self.indices[offsets + np.arange(total)]
+
+    def bfs(self, source):
+        """
+        Hop distance from source to every node (-1 = unreachable), level-synchronous:
+        one NumPy gather per BFS level instead of a Python loop per edge.
+        Time Complexity: O(V + E)
+        """
+        dist = np.full(self.n, -1, dtype=np.int64)
+        dist[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        while len(frontier):
+            nxt = self._expand(frontier)
+            nxt = np.unique(nxt[dist[nxt] < 0])
+            level += 1
+            dist[nxt] = level
+            frontier = nxt
+        return dist
+
+
+"""
+BENCHMARK: random graph with E edges, list of lists vs CSR
+
+Run from repo root: python -m dsa.graph-algos.csr-graph [edges]
+    memory: tracemalloc while building the list of lists vs CSR nbytes
+    BFS: list-based (undirected_graph_shortest_path loop) vs CSRGraph.bfs
+    Dijkstra: same function, list of (v, w) lists vs CSRGraph
+"""
+
+
+def benchmark(edges=10**7, n=10**6, seed=0):
+    import importlib
+    import time
+    import tracemalloc
+
+    shortest_paths = importlib.import_module("dsa.graph-algos.shortest-paths")
+
+    rng = np.random.default_rng(seed)
+    us = rng.integers(0, n, size=edges)
+    vs = rng.integers(0, n, size=edges)
+    ws = rng.random(edges)
+
+    start = time.perf_counter()
+    graph = CSRGraph.from_edges(n, us, vs, ws)
+    csr_build = time.perf_counter() - start
+
+    u_list, v_list, w_list = us.tolist(), vs.tolist(), ws.tolist()
+    tracemalloc.start()
+    start = time.perf_counter()
+    adjacency = [[] for _ in range(n)]
+    for u, v, w in zip(u_list, v_list, w_list):
+        adjacency[u].append((v, w))
+    list_build = time.perf_counter() - start
+    list_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    def list_bfs(source):
+        dist = [-1] * n
+        dist[source] = 0
+        queue = [source]
+        for node in queue:
+            for nei, _ in adjacency[node]:
+                if dist[nei] == -1:
+                    dist[nei] = dist[node] + 1
+                    queue.append(nei)
+        return dist
+
+    start = time.perf_counter()
+    expected = list_bfs(0)
+    list_bfs_time = time.perf_counter() - start
+    start = time.perf_counter()
+    assert graph.bfs(0).tolist() == expected
+    csr_bfs_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    list_dist, _ = shortest_paths.dijkstra(adjacency, n, 0)
+    list_dijkstra = time.perf_counter() - start
+    start = time.perf_counter()
+    csr_dist, _ = shortest_paths.dijkstra(graph, n, 0)
+    csr_dijkstra = time.perf_counter() - start
+    assert list_dist == csr_dist
+
+    print(f"n = {n}, E = {edges}")
+    print(f"{'':<16}{'list of lists':>16}{'CSR':>12}")
+    print(f"{'memory (MB)':<16}{list_memory / 2**20:>16.0f}{graph.nbytes / 2**20:>12.0f}")
+    print(f"{'build (s)':<16}{list_build:>16.2f}{csr_build:>12.2f}")
+    print(f"{'BFS (s)':<16}{list_bfs_time:>16.2f}{csr_bfs_time:>12.2f}")
+    print(f"{'Dijkstra (s)':<16}{list_dijkstra:>16.2f}{csr_dijkstra:>12.2f}")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**7)
@@ -0,0 +1,139 @@
+"""
+GRAPH: OFFLINE DYNAMIC CONNECTIVITY
+"""
+
+"""
+Problem: a stream of events on an undirected graph with n nodes
+    ("add", u, v)     insert edge u-v
+    ("remove", u, v)  delete edge u-v
+    ("query", u, v)   are u and v connected right now?
+All events are known up front (offline).
+
+A plain DSU cannot delete edges. Instead look at every edge as a TIME INTERVAL:
+    edge u-v is alive during [t_add, t_remove)   (t_remove = end if never removed)
+
+1. SEGMENT TREE OVER TIME
+   - leaves are event indices 0..T-1
+   - insert each edge interval into the O(log T) nodes that exactly cover it
+     (same decomposition as a range update)
+
+2. DFS OVER THE SEGMENT TREE WITH A ROLLBACK DSU
+   - entering a node: snapshot, union all edges stored at that node
+   - at leaf t: the DSU holds exactly the edges alive at time t -> answer the query
+   - leaving a node: rollback to the snapshot
+   - every edge is unioned / rolled back O(log T) times
+
+3. COMPLEXITY
+   - Time: O(T log T log n) (log n for find without path compression)
+   - Space: O(T log T) for the interval lists
+   - DFS is an explicit stack, no recursion
+"""
+
+from collections import defaultdict
+
+from dsa.basics.disjoint_set import RollbackDisjointSet
+
+
+def dynamic_connectivity(n, events):
+    """
+    Returns one bool per ("query", u, v) event, in order.
+    Duplicate edges are counted: an edge disappears after as many removes as adds.
+    """
+    T = len(events)
+    if T == 0:
+        return []
+    size = 1
+    while size < T:
+        size <<= 1
+    seg = defaultdict(list)
+
+    def add_interval(l, r, edge):
+        # half open [l, r) over leaves
+        l += size
+        r += size
+        while l < r:
+            if l & 1:
+                seg[l].append(edge)
+                l += 1
+            if r & 1:
+                r -= 1
+                seg[r].append(edge)
+            l >>= 1
+            r >>= 1
+
+    open_edges = defaultdict(list)  # edge -> start times of live copies
+    for t, (kind, u, v) in enumerate(events):
+        edge = (u, v) if u < v else (v, u)
+        if kind == "add":
+            open_edges[edge].append(t)
+        elif kind == "remove":
+            if not open_edges[edge]:
+                raise ValueError(f"Removing missing edge {edge} at time {t}")
+            add_interval(open_edges[edge].pop(), t, edge)
+        elif kind != "query":
+            raise ValueError(f"Unknown event: {kind}")
+    for edge, starts in open_edges.items():
+        for start in starts:
+            add_interval(start, T, edge)
+
+    ds = RollbackDisjointSet(n)
+    answers = {}
+    # (node, snapshot): snapshot is None on enter, set when the exit marker is pushed
+    stack = [(1, None)]
+    while stack:
+        node, snap = stack.pop()
+        if snap is not None:
+            ds.rollback(snap)
+            continue
+        if node >= size and node - size >= T:
+            continue
+        snap = ds.snapshot()
+        for u, v in seg.get(node, ()):
+            ds.union(u, v)
+        stack.append((node, snap))
+        if node >= size:
+            t = node - size
+            kind, u, v = events[t]
+            if kind == "query":
+                answers[t] = ds.connected(u, v)
+        else:
+            stack.append((2 * node + 1, None))
+            stack.append((2 * node, None))
+    return [answers[t] for t in range(T) if events[t][0] == "query"]
+
+
+"""
+BENCHMARK: random add / remove / query stream
+
+Run from repo root: python -m dsa.graph-algos.dynamic-connectivity [events]
+"""
+
+
+def benchmark(events=10**6, n=10**5, seed=0):
+    import random
+    import time
+
+    rng = random.Random(seed)
+    stream, live = [], []
+    for _ in range(events):
+        r = rng.random()
+        if r < 0.4 or not live:
+            u, v = rng.randrange(n), rng.randrange(n)
+            stream.append(("add", u, v))
+            live.append((u, v))
+        elif r < 0.6:
+            i = rng.randrange(len(live))
+            live[i], live[-1] = live[-1], live[i]
+            u, v = live.pop()
+            stream.append(("remove", u, v))
+        else:
+            stream.append(("query", rng.randrange(n), rng.randrange(n)))
+    start = time.perf_counter()
+    answers = dynamic_connectivity(n, stream)
+    print(f"{events} events, {len(answers)} queries, n = {n}: "
+          f"{time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
@@ -72,13 +72,23 @@ class GraphDict:
             self.graph[u] = [v]
         else:
             self.graph[u].append(v)
+
+
+3. CSR (compressed sparse row): indptr / indices / weights arrays, see csr-graph.py
+   - CSRGraph.from_adjacency(GraphDict), CSRGraph.from_matrix(GraphMatrix)
+   - graph[u] works like the adjacency list above; dfs(graph, s) accepts a CSRGraph,
+     weighted or not (it walks neighbor ids only)
+   - CSRGraph.bfs(s): level-synchronous BFS, one NumPy gather per level
 """
 
 """
 BFS & DFS
 """
+import importlib
 from collections import deque
 
+neighbor_ids = importlib.import_module("dsa.graph-algos.csr-graph").neighbor_ids
+
 def bfs(s):
     """
     Time complexity: O(V + E)
@@ -124,11 +134,12 @@ def dfs(graph, s):
     iscycle = False
     time = 0
     times = {s: (time, -1)}
+    neighbors = neighbor_ids(graph)
     
     while stack:
         current, par = stack[-1]
         unvisited_neighbor = None
-        for neighbor in graph[current]:
+        for neighbor in neighbors(current):
             if color.get(neighbor, "white") == "white":
                 unvisited_neighbor = neighbor
             elif color.get(neighbor) == "gray" and neighbor != par:
@@ -178,4 +189,16 @@ Then just check for the other unvisited set and run DFS / BFS again.
 And so on, until all the nodes are visited.
 
 O(n + m)
-"""
\ No newline at end of file
+"""
+
+"""
+Finding Connected Components: Union-Find
+
+No traversal needed: make_set every node, union(u, v) for every edge,
+find(x) is the component of x. Edges can arrive in any order, one at a time.
+
+O(n + m α(n))
+
+Edge lists too large for memory -> stream them into an array-backed DSU,
+see streaming-components.py
+"""
@@ -38,8 +38,15 @@ Subset of the edges of a connected, undirected graph that connects all the verti
 """
 
 import heapq
+import importlib
 from collections import defaultdict
 
+import numpy as np
+
+from dsa.basics.disjoint_set import IntDisjointSet
+
+CSRGraph = importlib.import_module("dsa.graph-algos.csr-graph").CSRGraph
+
 def kruskal_mst(edges, n):
     """
     Kruskal's algorithm for finding Minimum Spanning Tree.
@@ -54,16 +61,22 @@ def kruskal_mst(edges, n):
     
     Time Complexity: O(E log E) = O(E log V)
     Space Complexity: O(V)
+
+    Vertices are 0..n-1, so the array-backed IntDisjointSet replaces the dict based
+    DisjointSet (no make_set loop, union reports whether it merged -> one find pair per edge).
     """
     res = []
-    ds = DisjointSet()
-    for i in range(n):
-        ds.make_set(i)
-    sorted_edges = sorted(edges, key=lambda x: x[2])
+    ds = IntDisjointSet(n)
+    if isinstance(edges, CSRGraph):
+        # sort the weight array instead of a list of tuples
+        us, vs, ws = edges.to_edges()
+        order = np.argsort(ws, kind="stable")
+        sorted_edges = zip(us[order].tolist(), vs[order].tolist(), ws[order].tolist())
+    else:
+        sorted_edges = sorted(edges, key=lambda x: x[2])
     for u, v, weight in sorted_edges:
-        if ds.find(u) != ds.find(v):
+        if ds.union(u, v):
             res.append((u, v, weight))
-            ds.union(u, v)
             if len(res) == n - 1:
                 break
     return res
@@ -82,6 +95,7 @@ def prim_mst(graph, start=0):
     Time Complexity: O(E log V) with binary heap
     Space Complexity: O(V)
     """
+    n = len(graph)
     res = []
     vis = [False] * n
     pq = []  # Priority queue: (weight, u, v)
@@ -2,8 +2,16 @@
 GRAPH: SHORTEST PATH
 """
 
+import importlib
+import operator
 from collections import deque
 
+import numpy as np
+
+_csr = importlib.import_module("dsa.graph-algos.csr-graph")
+CSRGraph = _csr.CSRGraph
+weighted_neighbors = _csr.weighted_neighbors
+
 """
 Undirected graph
 
@@ -46,16 +54,203 @@ def dijkstra(graph, n, start):
     dis = [float('inf')] * n
     dis[start] = 0
     par = {start: None}
+    edges = weighted_neighbors(graph)  # CSRGraph: unweighted edges count as 1
     while pq:
         d, node = heapq.heappop(pq)
         if d > dis[node]: 
             continue
-        for nei, w in graph[node]:
+        for nei, w in edges(node):
             if dis[nei] > d + w:
                 dis[nei] = d + w
                 par[nei] = node
                 heapq.heappush(pq, (dis[nei], nei))
     return dis, par
+
+
+
+"""
+Point-to-point: shortest_path(graph, src, dst)
+
+dijkstra() above settles every reachable node and allocates O(V) arrays per call.
+For one target:
+- early stop: the target's distance is final when it is popped
+- dist / parent are dicts: only touched nodes cost memory (no O(V) setup per query)
+
+1. BIDIRECTIONAL DIJKSTRA
+   - forward search from src on the graph, backward search from dst on the reverse graph
+   - always advance the side with the smaller queue top
+   - mu = best d_f(u) + w + d_b(v) over edges scanned so far
+   - stop when top_f + top_b >= mu (no path through unsettled nodes can be shorter)
+   - each side settles ~ the nodes within half the distance: on a grid ~half the area
+
+2. A*: pop by d(v) + h(v), h = lower bound of dist(v, dst)
+   - h consistent (h(u) <= w(u, v) + h(v)) -> nodes are settled once, early stop is exact
+   - h = 0 is plain Dijkstra
+
+3. ALT (A*, Landmarks, Triangle inequality)
+   - pick a few landmarks L (far apart), precompute d(L, .) and d(., L) by full Dijkstra
+   - triangle inequality: dist(v, t) >= d(L, t) - d(L, v)  and  >= d(v, L) - d(t, L)
+   - h(v) = max over landmarks, consistent, no coordinates needed
+"""
+
+
+def _reverse_adjacency(graph, n):
+    if isinstance(graph, CSRGraph):
+        return graph.reverse()
+    reverse = [[] for _ in range(n)]
+    for u in range(n):
+        for v, w in graph[u]:
+            reverse[v].append((u, w))
+    return reverse
+
+
+def _path(parent, node):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    return path[::-1]
+
+
+def _astar(graph, src, dst, heuristic, stats):
+    dist = {src: 0}
+    parent = {src: None}
+    pq = [(heuristic(src), 0, src)]
+    settled = 0
+    edges = weighted_neighbors(graph)
+    while pq:
+        _, d, node = heapq.heappop(pq)
+        if d > dist[node]:
+            continue
+        settled += 1
+        if node == dst:
+            break
+        for nei, w in edges(node):
+            nd = d + w
+            if nd < dist.get(nei, float('inf')):
+                dist[nei] = nd
+                parent[nei] = node
+                heapq.heappush(pq, (nd + heuristic(nei), nd, nei))
+    if stats is not None:
+        stats["settled"] = settled
+    if dst not in dist:
+        return float('inf'), []
+    return dist[dst], _path(parent, dst)
+
+
+def _bidirectional(graph, reverse_graph, src, dst, stats):
+    if src == dst:
+        if stats is not None:
+            stats["settled"] = 0
+        return 0, [src]
+    dist = ({src: 0}, {dst: 0})
+    parent = ({src: None}, {dst: None})
+    pqs = ([(0, src)], [(0, dst)])
+    done = (set(), set())
+    edges = (weighted_neighbors(graph), weighted_neighbors(reverse_graph))
+    mu, meet = float('inf'), None
+    settled = 0
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= mu:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        d, node = heapq.heappop(pqs[side])
+        if node in done[side]:
+            continue
+        done[side].add(node)
+        settled += 1
+        own, other = dist[side], dist[1 - side]
+        for nei, w in edges[side](node):
+            nd = d + w
+            if nd < own.get(nei, float('inf')):
+                own[nei] = nd
+                parent[side][nei] = node
+                heapq.heappush(pqs[side], (nd, nei))
+            if nei in other and nd + other[nei] < mu:
+                mu, meet = nd + other[nei], nei
+    if stats is not None:
+        stats["settled"] = settled
+    if meet is None:
+        return float('inf'), []
+    forward = _path(parent[0], meet)
+    backward = _path(parent[1], meet)[::-1]  # meet .. dst
+    return mu, forward + backward[1:]
+
+
+class Landmarks:
+    """
+    ALT preprocessing: k landmarks chosen by farthest-point selection,
+    one forward + one backward full Dijkstra each.
+    """
+
+    def __init__(self, graph, n, k=8, reverse_graph=None, seed=0):
+        import random
+        if reverse_graph is None:
+            reverse_graph = _reverse_adjacency(graph, n)
+        rng = random.Random(seed)
+        self.nodes = []
+        from_rows, to_rows = [], []
+        closest = np.full(n, np.inf)
+        candidate = rng.randrange(n)
+        for _ in range(min(k, n)):
+            self.nodes.append(candidate)
+            from_rows.append(dijkstra(graph, n, candidate)[0])
+            to_rows.append(dijkstra(reverse_graph, n, candidate)[0])
+            closest = np.minimum(closest, np.array(from_rows[-1]))
+            reachable = np.where(np.isfinite(closest), closest, -1)
+            candidate = int(reachable.argmax())
+        # node-major: the k distances of a node are contiguous; unreachable -> a large
+        # finite value, so inf - inf never turns into nan (BIG - BIG = 0 says nothing)
+        big = np.finfo(np.float64).max / 4
+        self.k = len(self.nodes)
+        self.dist_from = np.minimum(np.array(from_rows).T, big).ravel()  # d(L, v)
+        self.dist_to = np.minimum(np.array(to_rows).T, big).ravel()      # d(v, L)
+        self._from = memoryview(self.dist_from)
+        self._to = memoryview(self.dist_to)
+
+    def heuristic(self, dst):
+        """
+        h(v) = max_L max(d(L, dst) - d(L, v), d(v, L) - d(dst, L)), memoized per query.
+        O(k) Python float ops per node (a NumPy call per node costs more than that).
+        """
+        k, dist_from, dist_to = self.k, self._from, self._to
+        from_t = dist_from[dst * k:(dst + 1) * k].tolist()
+        to_t = dist_to[dst * k:(dst + 1) * k].tolist()
+        cache = {}
+
+        def h(v):
+            bound = cache.get(v)
+            if bound is None:
+                row = slice(v * k, (v + 1) * k)
+                bound = max(0.0, max(map(operator.sub, from_t, dist_from[row])),
+                            max(map(operator.sub, dist_to[row], to_t)))
+                cache[v] = bound
+            return bound
+        return h
+
+
+def shortest_path(graph, src, dst, n=None, method="bidirectional", heuristic=None,
+                  landmarks=None, reverse_graph=None, stats=None):
+    """
+    Distance and node path from src to dst (inf, [] if unreachable).
+        method="dijkstra":       one-sided, stops at dst
+        method="bidirectional":  bidirectional Dijkstra (reverse_graph built if not given)
+        method="astar":          A* with heuristic(v), or the ALT bound of `landmarks`
+    stats: optional dict, receives "settled" (number of nodes settled).
+    Time Complexity: O((V + E) log V) worst case, usually a small fraction of the graph
+    """
+    n = len(graph) if n is None else n
+    if method == "dijkstra":
+        return _astar(graph, src, dst, lambda v: 0, stats)
+    if method == "astar":
+        if heuristic is None:
+            heuristic = landmarks.heuristic(dst) if landmarks else (lambda v: 0)
+        return _astar(graph, src, dst, heuristic, stats)
+    if method == "bidirectional":
+        if reverse_graph is None:
+            reverse_graph = _reverse_adjacency(graph, n)
+        return _bidirectional(graph, reverse_graph, src, dst, stats)
+    raise ValueError(f"Unknown method: {method}")
         
 
 """
@@ -71,6 +266,8 @@ Algo:
 """
 
 def bellman_ford(edges, n, start):
+    if isinstance(edges, CSRGraph):
+        return bellman_ford_csr(edges, start)
     dist = [float('inf')] * n
     dist[start] = 0
     for _ in range(n - 1):
@@ -84,6 +281,26 @@ def bellman_ford(edges, n, start):
             raise ValueError("Graph contains negative weight cycle")
     return dist
 
+
+def bellman_ford_csr(graph, start):
+    """
+    Same relaxation rounds, but each round relaxes ALL edges in one NumPy pass:
+        dist[v] = min(dist[v], dist[u] + w)  ->  np.minimum.at
+    Stops early once a round changes nothing. An unweighted graph counts every edge as 1.
+    - O(VE) worst case, usually far fewer rounds
+    """
+    us, vs, _ = graph.to_edges()
+    ws = graph.edge_weights()
+    dist = np.full(graph.n, np.inf)
+    dist[start] = 0
+    for _ in range(graph.n):
+        new = dist.copy()
+        np.minimum.at(new, vs, dist[us] + ws)
+        if np.array_equal(new, dist):
+            return dist.tolist()
+        dist = new
+    raise ValueError("Graph contains negative weight cycle")
+
 """
 Floyd Warshall
 - works for negative cycles
@@ -104,6 +321,189 @@ def floyd_warshall(graph, n):
                 dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
     return dist
 
+
+"""
+Floyd Warshall, vectorized
+- the k-th step updates every (i, j) at once, a rank-1 "min-plus" update:
+      dist = min(dist, dist[:, k, None] + dist[None, k, :])
+  row k and column k do not change during step k (dist[k][k] >= 0), so it runs in place
+- predecessors: pred[i][j] = node before j on a shortest i -> j path (-1: none)
+      improving (i, j) through k  ->  pred[i][j] = pred[k][j]
+- negative cycle  <=>  some dist[i][i] < 0 at the end
+
+Blocked (tiled) variant: the plain version streams the whole n x n matrix through
+memory n times. Split k into blocks of b:
+    1. pivot row / column panels: Floyd Warshall restricted to rows kb / columns kb
+    2. every other tile (i, j):  tile = min(tile, C[i, kb] (min,+) R[kb, j])
+       all b steps of k run on one cache-resident tile before moving on
+- same O(V³) work, about b times less memory traffic
+"""
+
+
+def _dense(graph, n=None):
+    """
+    float64 weight matrix, inf = no edge, 0 on the diagonal (cheapest parallel edge kept).
+    graph: CSRGraph, adjacency lists of (v, w) pairs, or an n x n np.ndarray of weights
+    (inf = no edge). A list of lists is always read as adjacency lists, pass
+    np.asarray(matrix) for a dense matrix.
+    """
+    if isinstance(graph, np.ndarray):
+        dist = graph.astype(np.float64)
+    else:
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_adjacency(graph, n)
+        us, vs, _ = graph.to_edges()
+        ws = graph.edge_weights()
+        dist = np.full((graph.n, graph.n), np.inf)
+        np.minimum.at(dist, (us, vs), ws)
+    diagonal = np.einsum('ii->i', dist)
+    np.minimum(diagonal, 0, out=diagonal)
+    return dist
+
+
+def _initial_pred(dist):
+    n = len(dist)
+    pred = np.repeat(np.arange(n, dtype=np.int32)[:, None], n, axis=1)
+    pred[np.isinf(dist)] = -1
+    np.fill_diagonal(pred, -1)
+    return pred
+
+
+def _check_negative_cycle(dist):
+    if (np.diagonal(dist) < 0).any() or np.isnan(dist).any():
+        raise ValueError("Graph contains negative weight cycle")
+
+
+def floyd_warshall_numpy(graph, n=None, predecessors=False):
+    """
+    dist matrix (NumPy), or (dist, pred) with predecessors=True.
+    graph: CSRGraph, adjacency lists of (v, w) pairs or an n x n np.ndarray.
+    Raises ValueError on a negative weight cycle.
+    Time Complexity: O(V³), n NumPy operations of n² each
+    Space Complexity: O(V²)
+    """
+    dist = _dense(graph, n)
+    n = len(dist)
+    pred = _initial_pred(dist) if predecessors else None
+    through = np.empty_like(dist)
+    better = np.empty(dist.shape, dtype=bool) if predecessors else None
+    for k in range(n):
+        np.add(dist[:, k, None].copy(), dist[k], out=through)
+        if predecessors:
+            np.less(through, dist, out=better)
+            np.copyto(pred, pred[k].copy(), where=better)
+        np.minimum(dist, through, out=dist)
+    _check_negative_cycle(dist)
+    return (dist, pred) if predecessors else dist
+
+
+def _improves(through, through_hops, d, hops, out=None, scratch=None):
+    """Strictly shorter, or as short with fewer edges (inf hops when unreachable)."""
+    better = np.less(through_hops, hops, out=out)
+    tie = np.equal(through, d, out=scratch)
+    better &= tie
+    better |= np.less(through, d, out=tie)
+    return better
+
+
+def _panel(dist, pred, hops, ks, rows, cols):
+    """
+    Floyd Warshall over intermediates ks, restricted to dist[rows, cols] (a view).
+    Row panel: rows=ks, cols=all. Column panel: rows outside ks, cols=ks, run after
+    the row panel so dist[k, ks] is already final.
+    """
+    d = dist[rows, cols]
+    p = None if pred is None else pred[rows, cols]
+    h = None if pred is None else hops[rows, cols]
+    for k in range(ks.start, ks.stop):
+        through = dist[rows, k, None] + dist[k, cols]
+        if p is not None:
+            through_hops = hops[rows, k, None] + hops[k, cols]
+            better = _improves(through, through_hops, d, h)
+            np.copyto(p, pred[k, cols].copy(), where=better)
+            np.copyto(h, through_hops, where=better)
+        np.minimum(d, through, out=d)
+
+
+def floyd_warshall_blocked(graph, n=None, predecessors=False, block=128):
+    """
+    Cache-blocked Floyd Warshall, same distances as floyd_warshall_numpy.
+    Each tile outside the pivot panels is copied into a contiguous buffer, updated
+    by all b steps of the k-block, then written back (block=128: a few tiles fit in L2).
+    The panels already route dist[i][k] through later pivots of the same block, so
+    with zero-weight cycles plain "strictly shorter" can loop the predecessors; ties
+    are broken on edge count instead (every cycle has >= 1 edge).
+    Time Complexity: O(V³)
+    Space Complexity: O(V²)
+    """
+    dist = _dense(graph, n)
+    n = len(dist)
+    pred = hops = None
+    if predecessors:
+        pred = _initial_pred(dist)
+        hops = np.where(pred >= 0, 1.0, np.inf)
+        np.fill_diagonal(hops, 0)
+    tile_buf, through_buf = np.empty((block, block)), np.empty((block, block))
+    hops_buf, through_hops_buf = np.empty((block, block)), np.empty((block, block))
+    better_buf, scratch_buf = np.empty((block, block), dtype=bool), np.empty((block, block), dtype=bool)
+    everything = slice(0, n)
+    for start in range(0, n, block):
+        ks = slice(start, min(start + block, n))
+        _panel(dist, pred, hops, ks, ks, everything)
+        _panel(dist, pred, hops, ks, slice(0, start), ks)
+        _panel(dist, pred, hops, ks, slice(ks.stop, n), ks)
+        CT, R = dist[:, ks].T.copy(), dist[ks, :].copy()
+        if predecessors:
+            P, HT, HR = pred[ks, :].copy(), hops[:, ks].T.copy(), hops[ks, :].copy()
+        for i in range(0, n, block):
+            if i == start:
+                continue
+            rows = slice(i, min(i + block, n))
+            for j in range(0, n, block):
+                if j == start:
+                    continue
+                cols = slice(j, min(j + block, n))
+                h, w = rows.stop - i, cols.stop - j
+                tile, through, better = tile_buf[:h, :w], through_buf[:h, :w], better_buf[:h, :w]
+                np.copyto(tile, dist[rows, cols])
+                if predecessors:
+                    p, tile_hops, through_hops = pred[rows, cols], hops_buf[:h, :w], through_hops_buf[:h, :w]
+                    np.copyto(tile_hops, hops[rows, cols])
+                for k in range(ks.stop - start):
+                    np.add(CT[k, rows, None], R[k, cols], out=through)
+                    if predecessors:
+                        np.add(HT[k, rows, None], HR[k, cols], out=through_hops)
+                        _improves(through, through_hops, tile, tile_hops, better, scratch_buf[:h, :w])
+                        np.copyto(p, P[k, cols], where=better)
+                        np.copyto(tile_hops, through_hops, where=better)
+                    np.minimum(tile, through, out=tile)
+                dist[rows, cols] = tile
+                if predecessors:
+                    hops[rows, cols] = tile_hops
+    _check_negative_cycle(dist)
+    return (dist, pred) if predecessors else dist
+
+
+def floyd_warshall_path(pred, src, dst):
+    """
+    Node path src -> dst from a predecessor matrix ([] if unreachable).
+    Raises ValueError if the predecessors loop instead of reaching src.
+    Time Complexity: O(path length)
+    """
+    if src == dst:
+        return [src]
+    if pred[src][dst] < 0:
+        return []
+    path = [dst]
+    for _ in range(len(pred)):
+        dst = int(pred[src][dst])
+        path.append(dst)
+        if dst == src:
+            return path[::-1]
+        if dst < 0:
+            break
+    raise ValueError(f"Predecessor matrix has no path {src} -> {path[0]}")
+
 """
 Using toposort
 - DAG
@@ -132,4 +532,138 @@ def toposort(graph, start, n):
         for ne, w in graph[node]:
             if dis[ne] > dis[node] + w:
                 dis[ne] = dis[node] + w
-    print(dis)
\ No newline at end of file
+    print(dis)
+
+
+"""
+BENCHMARK: nodes settled per point-to-point query
+
+Run from repo root: python -m dsa.graph-algos.shortest-paths [side]
+                    python -m dsa.graph-algos.shortest-paths fw [n ...]
+    grid:       side x side, 4-neighbors, random weights 1..10
+    road-like:  same grid, but every 10th row / column is a "highway" (weight 1)
+                and a few edges are missing
+    full dijkstra settles every reachable node; the others stop at the target
+    fw:         random directed graph, ~8 out-edges per node, weights 1..100;
+                the pure-Python floyd_warshall is only timed at n = 200 (1.5 s)
+
+                    n    numpy    blocked    blocked + pred     (seconds, one core)
+                 2000     18.2       14.6          39.3
+                 3000     53.6       39.3         113.7
+                 5000    338.9      208.8         615.1
+"""
+
+
+def _grid_graph(side, rng, road=False):
+    n = side * side
+    ids = np.arange(n).reshape(side, side)
+    us = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    vs = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    ws = rng.integers(1, 11, size=len(us)).astype(np.float64)
+    if road:
+        row, col = us // side, us % side
+        horizontal = vs == us + 1
+        highway = np.where(horizontal, row % 10 == 0, col % 10 == 0)
+        ws[highway] = 1
+        keep = highway | (rng.random(len(us)) > 0.1)
+        us, vs, ws = us[keep], vs[keep], ws[keep]
+    return CSRGraph.from_edges(n, us, vs, ws, directed=False)
+
+
+def benchmark(side=300, queries=20, landmarks=8, seed=0):
+    import random
+    import time
+
+    for name, road in (("grid", False), ("road-like", True)):
+        rng = np.random.default_rng(seed)
+        graph = _grid_graph(side, rng, road)
+        n = graph.n
+        reverse_graph = graph.reverse()
+        start = time.perf_counter()
+        alt = Landmarks(graph, n, landmarks, reverse_graph)
+        prep = time.perf_counter() - start
+        pick = random.Random(seed)
+        pairs = [(pick.randrange(n), pick.randrange(n)) for _ in range(queries)]
+        print(f"{name}: n = {n}, E = {graph.num_edges}, ALT preprocessing {prep:.1f} s")
+        print(f"{'method':<24}{'settled / query':>16}{'ms / query':>12}")
+
+        start = time.perf_counter()
+        for s, _ in pairs:
+            dijkstra(graph, n, s)
+        full_ms = (time.perf_counter() - start) * 1e3 / queries
+        print(f"{'dijkstra (full)':<24}{n:>16}{full_ms:>12.1f}")
+
+        for label, kwargs in (("dijkstra, early stop", {"method": "dijkstra"}),
+                              ("bidirectional", {"method": "bidirectional", "reverse_graph": reverse_graph}),
+                              ("A* + ALT", {"method": "astar", "landmarks": alt})):
+            settled = 0
+            start = time.perf_counter()
+            for s, t in pairs:
+                stats = {}
+                shortest_path(graph, s, t, n, stats=stats, **kwargs)
+                settled += stats["settled"]
+            ms = (time.perf_counter() - start) * 1e3 / queries
+            print(f"{label:<24}{settled // queries:>16}{ms:>12.1f}")
+
+
+def _check_floyd_warshall_predecessors(trials=50, seed=0):
+    """Blocked and NumPy predecessors give paths of the same cost, also with 0-weight cycles."""
+    rng = np.random.default_rng(seed)
+    for _ in range(trials):
+        n = int(rng.integers(2, 25))
+        m = 3 * n
+        us, vs = rng.integers(0, n, m), rng.integers(0, n, m)
+        graph = CSRGraph.from_edges(n, us, vs, rng.choice([0.0, 0.0, 1.0, 2.0], m))
+        weight = _dense(graph)
+        dist, pred = floyd_warshall_numpy(graph, predecessors=True)
+        for block in (1, 2, 3, 8):
+            blocked_dist, blocked_pred = floyd_warshall_blocked(graph, predecessors=True, block=block)
+            assert np.array_equal(blocked_dist, dist)
+            for p in (pred, blocked_pred):
+                for src in range(n):
+                    for dst in range(n):
+                        path = floyd_warshall_path(p, src, dst)
+                        cost = sum(weight[u, v] for u, v in zip(path, path[1:])) if path else np.inf
+                        assert cost == dist[src, dst]
+
+
+def benchmark_floyd_warshall(sizes=(2000, 3000, 5000), degree=8, seed=0):
+    import time
+
+    _check_floyd_warshall_predecessors()
+    rng = np.random.default_rng(seed)
+    small = 200
+    graph = [[] for _ in range(small)]
+    for u, v, w in zip(rng.integers(0, small, small * degree), rng.integers(0, small, small * degree),
+                       rng.integers(1, 101, small * degree)):
+        graph[u].append((int(v), float(w)))
+    start = time.perf_counter()
+    floyd_warshall(graph, small)
+    print(f"floyd_warshall (lists), n = {small}: {time.perf_counter() - start:.1f} s")
+
+    print(f"{'n':>6}{'numpy s':>10}{'blocked s':>11}{'+ pred s':>10}")
+    for n in sizes:
+        us, vs = rng.integers(0, n, n * degree), rng.integers(0, n, n * degree)
+        graph = CSRGraph.from_edges(n, us, vs, rng.integers(1, 101, n * degree).astype(np.float64))
+        times = []
+        for f, kwargs in ((floyd_warshall_numpy, {}), (floyd_warshall_blocked, {}),
+                          (floyd_warshall_blocked, {"predecessors": True})):
+            start = time.perf_counter()
+            result = f(graph, **kwargs)
+            times.append(time.perf_counter() - start)
+            if not kwargs:
+                if f is floyd_warshall_numpy:
+                    expected = result
+                else:
+                    assert np.array_equal(result, expected)
+            del result
+        del expected
+        print(f"{n:>6}{times[0]:>10.1f}{times[1]:>11.1f}{times[2]:>10.1f}")
+
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:2] == ["fw"]:
+        benchmark_floyd_warshall(tuple(map(int, sys.argv[2:])) or (2000, 3000, 5000))
+    else:
+        benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
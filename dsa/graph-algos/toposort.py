@@ -17,14 +17,22 @@ Applications:
 - etc.
 """
 
+import importlib
 from collections import deque, defaultdict
 
+import numpy as np
+
+_csr = importlib.import_module("dsa.graph-algos.csr-graph")
+CSRGraph = _csr.CSRGraph
+neighbor_ids = _csr.neighbor_ids
+
 def topological_sort_dfs(graph, n):
-    """doesn't have cycle detection"""
+    """doesn't have cycle detection, graph may also be a CSRGraph"""
     res = []
     vis = set()
+    successors = neighbor_ids(graph)
     def dfs(node):
-        for nei in graph[node]:
+        for nei in successors(node):
             if nei not in vis:
                 vis.add(nei)
                 dfs(nei)
@@ -38,20 +46,40 @@ def topological_sort_dfs(graph, n):
 
 
 def topological_sort_bfs(edges, n):
-    """has cycle detection"""
+    """has cycle detection, edges may also be a CSRGraph"""
     res = []
-    inorder = [0] * n
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-        inorder[v] += 1
+    if isinstance(edges, CSRGraph):
+        successors = edges.targets
+        inorder = np.bincount(edges.indices, minlength=n).tolist()
+    else:
+        inorder = [0] * n
+        graph = defaultdict(list)
+        for u, v in edges:
+            graph[u].append(v)
+            inorder[v] += 1
+        successors = graph.__getitem__
 
     q = deque(list(filter(lambda x: inorder[x] == 0, range(n))))
     while q:
         node = q.popleft()
-        for nei in graph[node]:
+        res.append(node)
+        for nei in successors(node):
             inorder[nei] -= 1
-            res.append(nei)
             if not inorder[nei]:
                 q.append(nei)
-    return res[::-1] if len(res) == n else []
\ No newline at end of file
+    return res if len(res) == n else []
+
+if __name__ == "__main__":
+    # weighted and unweighted CSR DAGs: every edge must go forward in both orders
+    rng = np.random.default_rng(0)
+    n = 1000
+    us, vs = rng.integers(0, n, 5000), rng.integers(0, n, 5000)
+    forward = us < vs
+    rank = rng.permutation(n)
+    us, vs = rank[us[forward]], rank[vs[forward]]
+    for graph in (CSRGraph.from_edges(n, us, vs, rng.random(len(us))), CSRGraph.from_edges(n, us, vs)):
+        for order in (topological_sort_dfs(graph, n), topological_sort_bfs(graph, n)):
+            position = np.empty(n, dtype=np.int64)
+            position[order] = np.arange(n)
+            assert len(order) == n and (position[us] < position[vs]).all()
+    print("ok")
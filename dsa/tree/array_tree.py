@@ -0,0 +1,235 @@
+"""
+ARRAY-BACKED BINARY TREE (STRUCT OF ARRAYS)
+"""
+
+"""
+1. WHY?
+   - TreeNode stores every node as a Python object (val, left, right + __dict__)
+   - Recursive traversals on TreeNode hit the recursion limit (~1000) on skewed trees
+     and build a full result list even when the caller only needs a prefix
+
+2. REPRESENTATION:
+   - Node i is an integer id, children are stored in parallel arrays
+
+        index:   0   1   2   3   4
+        value:  [1,  2,  3,  4,  5]
+        left:   [1,  3, -1, -1, -1]         1
+        right:  [2,  4, -1, -1, -1]        / \\
+                                          2   3
+                                         / \\
+                                        4   5
+
+   - NIL = -1 marks a missing child
+   - left / right are array('i'): 4 bytes per link, contiguous
+   - Nodes are appended, so ids are stable (handy for LCA / HLD tables built on top)
+
+3. TRAVERSALS:
+   - All traversals are generators driven by an explicit stack / queue
+   - Depth of the tree only grows the stack list, never the interpreter call stack
+   - level_order_numpy: whole level at a time, frontier is an index array
+        children = stack(left[frontier], right[frontier]).ravel()
+        frontier = children[children != NIL]
+"""
+
+from array import array
+from collections import deque
+
+from dsa.tree.tree import TreeNode
+
+NIL = -1
+
+
+class ArrayTree:
+
+    def __init__(self):
+        self.values = []
+        self.left = array('i')
+        self.right = array('i')
+        self.root = NIL
+
+    def __len__(self):
+        return len(self.values)
+
+    def add_node(self, value, parent=NIL, is_left=True):
+        """
+        Append a node and attach it under parent (or make it the root).
+        Returns the id of the new node.
+        Raises ValueError if the root / that child slot is already taken: replacing it
+        would orphan the existing subtree.
+        Time Complexity: O(1) amortized
+        """
+        links = None if parent == NIL else (self.left if is_left else self.right)
+        if (self.root if links is None else links[parent]) != NIL:
+            where = "root" if links is None else f"{'left' if is_left else 'right'} child of {parent}"
+            raise ValueError(f"Tree already has a {where}")
+        node = len(self.values)
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        if links is None:
+            self.root = node
+        else:
+            links[parent] = node
+        return node
+
+    # ---------------------------------------------------------------------------------
+    # Converters
+    # ---------------------------------------------------------------------------------
+
+    @classmethod
+    def from_treenode(cls, root):
+        """
+        Copy a TreeNode tree, ids are assigned in level order.
+        Time Complexity: O(n)
+        """
+        tree = cls()
+        if root is None:
+            return tree
+        queue = deque([(root, tree.add_node(root.val))])
+        while queue:
+            node, idx = queue.popleft()
+            if node.left:
+                queue.append((node.left, tree.add_node(node.left.val, idx, True)))
+            if node.right:
+                queue.append((node.right, tree.add_node(node.right.val, idx, False)))
+        return tree
+
+    def to_treenode(self):
+        """
+        Time Complexity: O(n)
+        """
+        if self.root == NIL:
+            return None
+        nodes = [TreeNode(value) for value in self.values]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NIL:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NIL:
+                node.right = nodes[self.right[i]]
+        return nodes[self.root]
+
+    # ---------------------------------------------------------------------------------
+    # Traversals (iterative generators, yield node ids)
+    # ---------------------------------------------------------------------------------
+
+    def preorder(self):
+        """
+        Time complexity: O(n)
+        Space complexity: O(h)
+        """
+        left, right = self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if right[node] != NIL:
+                stack.append(right[node])
+            if left[node] != NIL:
+                stack.append(left[node])
+
+    def inorder(self):
+        """
+        Time complexity: O(n)
+        Space complexity: O(h)
+        """
+        left, right = self.left, self.right
+        stack = []
+        node = self.root
+        while node != NIL or stack:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield node
+            node = right[node]
+
+    def postorder(self):
+        """
+        Single stack: a node is emitted once its right subtree was the last thing emitted.
+        Time complexity: O(n)
+        Space complexity: O(h)
+        """
+        left, right = self.left, self.right
+        stack = []
+        node = self.root
+        last = NIL
+        while node != NIL or stack:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            top = stack[-1]
+            if right[top] != NIL and right[top] != last:
+                node = right[top]
+            else:
+                last = stack.pop()
+                yield last
+
+    def level_order(self):
+        """
+        Yields one list of node ids per level.
+        Time complexity: O(n)
+        Space complexity: O(w), w is the max width of the tree
+        """
+        left, right = self.left, self.right
+        level = [self.root] if self.root != NIL else []
+        while level:
+            yield level
+            nxt = []
+            for node in level:
+                if left[node] != NIL:
+                    nxt.append(left[node])
+                if right[node] != NIL:
+                    nxt.append(right[node])
+            level = nxt
+
+    def level_order_numpy(self):
+        """
+        Vectorized level order, yields one np.ndarray of node ids per level.
+        One NumPy call per level instead of one Python step per node.
+        Time complexity: O(n) work, O(h) Python iterations
+        """
+        import numpy as np
+
+        left = np.frombuffer(self.left, dtype=np.int32)
+        right = np.frombuffer(self.right, dtype=np.int32)
+        frontier = np.array([self.root] if self.root != NIL else [], dtype=np.int32)
+        while frontier.size:
+            yield frontier
+            children = np.stack((left[frontier], right[frontier]), axis=1).ravel()
+            frontier = children[children != NIL]
+
+    def values_of(self, nodes):
+        values = self.values
+        return [values[node] for node in nodes]
+
+    def height(self):
+        return sum(1 for _ in self.level_order())
+
+
+"""
+COMPARISON WITH TreeNode
+========================
+
+| Aspect                | TreeNode (recursive)     | ArrayTree                      |
+|-----------------------|--------------------------|--------------------------------|
+| Memory per node       | object + __dict__        | value slot + 2 x 4 byte links  |
+| Max depth             | ~sys.getrecursionlimit() | limited by memory only         |
+| Traversal result      | full list                | lazy generator of ids          |
+| Level order           | Python loop per node     | NumPy op per level             |
+"""
+
+
+if __name__ == "__main__":
+    # depth stress: 10^5 deep left chain and right chain, no recursion involved
+    depth = 10**5
+    for is_left in (True, False):
+        tree = ArrayTree()
+        parent = NIL
+        for i in range(depth):
+            parent = tree.add_node(i, parent, is_left)
+        assert sum(1 for _ in tree.preorder()) == depth
+        assert sum(1 for _ in tree.inorder()) == depth
+        assert list(tree.postorder())[-1] == tree.root
+        assert tree.height() == depth
+        assert ArrayTree.from_treenode(tree.to_treenode()).values == tree.values
+    print("ok")
@@ -42,27 +42,65 @@ class BinarySearchTree:
         self.root = None
         self.size = 0
     
+    @classmethod
+    def from_sorted(cls, keys):
+        """
+        Bulk-load a perfectly balanced BST from strictly increasing keys.
+        Middle key becomes the root, left / right halves become the subtrees.
+        Built with an explicit stack of index ranges, so no recursion limit.
+
+        Time Complexity: O(n) (vs O(n^2) for inserting sorted keys one at a time)
+        Space Complexity: O(n) for the nodes, O(log n) for the stack
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        for i in range(1, len(keys)):
+            if keys[i - 1] >= keys[i]:
+                raise ValueError(f"Keys must be strictly increasing, got {keys[i - 1]} before {keys[i]}")
+        tree = cls()
+        tree.size = len(keys)
+        # (lo, hi, parent, attach_left): build node for keys[lo:hi]
+        stack = [(0, len(keys), None, False)]
+        while stack:
+            lo, hi, parent, attach_left = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            node = TreeNode(keys[mid])
+            node.parent = parent
+            if parent is None:
+                tree.root = node
+            elif attach_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((mid + 1, hi, node, False))
+            stack.append((lo, mid, node, True))
+        return tree
+
     def is_empty(self):
         return self.root is None
     
     def get_size(self):
         return self.size
     
-    def insert(self, x, node=None, parent=None):
+    def insert(self, x):
         """
         Insert a new key into the BST.
         Time Complexity: O(h) where h is height of tree
         Space Complexity: O(h) for recursion stack
         """
+        self.root = self._insert_recursive(x, self.root, None)
+
+    def _insert_recursive(self, x, node, parent):
         if not node:
             node = TreeNode(x)
             node.parent = parent
             self.size += 1
             return node
-        if x < node.val:
-            node.left = self.insert(x, node.left, node)
-        elif x > node.val: 
-            node.right = self.insert(x, node.right, node)
+        if x < node.key:
+            node.left = self._insert_recursive(x, node.left, node)
+        elif x > node.key:
+            node.right = self._insert_recursive(x, node.right, node)
         return node
             
     def search_recursive(self, node, key):
@@ -83,6 +121,18 @@ class BinarySearchTree:
                 current = current.right
         return None
     
+    def find_min(self, node=None):
+        node = node or self.root
+        while node is not None and node.left is not None:
+            node = node.left
+        return node
+
+    def find_max(self, node=None):
+        node = node or self.root
+        while node is not None and node.right is not None:
+            node = node.right
+        return node
+
     def successor(self, key):
         """
         Find the successor (next larger element) of a given key.
@@ -142,22 +192,37 @@ class BinarySearchTree:
     
     def _delete_recursive(self, node, key):
         if not node: return None
-        if node.val < key:
+        if node.key < key:
             node.right = self._delete_recursive(node.right, key)
             return node
-        elif node.val > key:
+        elif node.key > key:
             node.left = self._delete_recursive(node.left, key)
             return node
         else:
-            self.size -= 1
-            if node.left is None and node.right is None:
-                return None
-            elif node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
+            # two children: the successor's own deletion below does the size -= 1
+            if node.left is None or node.right is None:
+                self.size -= 1
+                child = node.left or node.right
+                if child:
+                    child.parent = node.parent
+                return child
             else:
                 successor = self.find_min(node.right)
                 node.key = successor.key
                 node.right = self._delete_recursive(node.right, successor.key)
         return node
+
+
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(0)
+    keys = rng.sample(range(1000), 100)
+    tree = BinarySearchTree()
+    for key in keys:
+        tree.insert(key)
+    assert tree.get_size() == 100
+    for i, key in enumerate(rng.sample(keys, 50) + [1000]):
+        tree.delete(key)
+        assert tree.get_size() == max(99 - i, 50)
+    print("ok")
@@ -0,0 +1,229 @@
+"""
+HEAVY-LIGHT DECOMPOSITION (HLD)
+"""
+
+"""
+1. IDEA:
+   - For every node pick the child with the largest subtree as its HEAVY child
+   - Heavy edges form vertical chains, every other edge is LIGHT
+   - Going up a light edge at least doubles the subtree size
+       -> any root-to-node path crosses O(log n) light edges -> O(log n) chains
+
+2. POSITION MAPPING:
+   - DFS that always descends into the heavy child first
+   - pos[v] = DFS entry time, head[v] = top node of v's chain
+   - every chain occupies a contiguous range of positions: [pos[head], pos[v]]
+   - every subtree occupies a contiguous range too: [pos[v], pos[v] + size[v] - 1]
+   - so one segment tree over positions answers both path and subtree queries
+
+3. PATH QUERY (u, v):
+        while head[u] != head[v]:
+            move the endpoint whose chain head is deeper:
+                query [pos[head[u]], pos[u]], u = parent[head[u]]
+        query [min(pos[u], pos[v]), max(pos[u], pos[v])]
+   - O(log n) chains x O(log n) segment tree = O(log^2 n)
+   - the node where the loop ends on the shallower side is the LCA
+
+4. VS NAIVE PARENT WALK:
+   - walk: O(depth) per query, O(n) on deep trees
+   - HLD: O(log^2 n) regardless of shape
+"""
+
+import random
+import sys
+import time
+
+from dsa.tree.array_tree import NIL
+from dsa.tree.segment_tree import RangeAddSegmentTree
+
+
+class HeavyLightDecomposition:
+
+    def __init__(self, parent, values=None):
+        """
+        parent: parent[root] = -1
+        values: initial node values (default 0)
+        Time Complexity: O(n)
+        """
+        n = len(parent)
+        self.n = n
+        self.parent = list(parent)
+        children = [[] for _ in range(n)]
+        root = NIL
+        for v, p in enumerate(self.parent):
+            if p == NIL:
+                if root != NIL:
+                    raise ValueError("Expected exactly one root")
+                root = v
+            else:
+                children[p].append(v)
+        if root == NIL:
+            raise ValueError("Expected exactly one root")
+        self.root = root
+
+        # BFS order: parents before children, reverse gives children before parents
+        order = [root]
+        depth = [0] * n
+        for v in order:
+            for c in children[v]:
+                depth[c] = depth[v] + 1
+                order.append(c)
+        size = [1] * n
+        heavy = [NIL] * n
+        for v in reversed(order):
+            best = 0
+            for c in children[v]:
+                size[v] += size[c]
+                if size[c] > best:
+                    best, heavy[v] = size[c], c
+
+        # heavy-first DFS, push heavy child last so it is popped next
+        head = [0] * n
+        pos = [0] * n
+        head[root] = root
+        stack = [root]
+        t = 0
+        while stack:
+            v = stack.pop()
+            pos[v] = t
+            t += 1
+            for c in children[v]:
+                if c != heavy[v]:
+                    head[c] = c
+                    stack.append(c)
+            if heavy[v] != NIL:
+                head[heavy[v]] = head[v]
+                stack.append(heavy[v])
+
+        self.depth, self.size, self.heavy, self.head, self.pos = depth, size, heavy, head, pos
+        values = values if values is not None else [0] * n
+        base = [0] * n
+        for v in range(n):
+            base[pos[v]] = values[v]
+        self.seg = RangeAddSegmentTree(base)
+
+    @classmethod
+    def from_array_tree(cls, tree, values=None):
+        parent = [NIL] * len(tree)
+        for v in range(len(tree)):
+            if tree.left[v] != NIL:
+                parent[tree.left[v]] = v
+            if tree.right[v] != NIL:
+                parent[tree.right[v]] = v
+        return cls(parent, values if values is not None else tree.values)
+
+    def _path_ranges(self, u, v):
+        """
+        Decompose the u-v path into O(log n) position ranges.
+        """
+        head, pos, depth, parent = self.head, self.pos, self.depth, self.parent
+        ranges = []
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            ranges.append((pos[head[u]], pos[u]))
+            u = parent[head[u]]
+        ranges.append((min(pos[u], pos[v]), max(pos[u], pos[v])))
+        return ranges
+
+    def lca(self, u, v):
+        """
+        Time Complexity: O(log n)
+        """
+        head, depth, parent = self.head, self.depth, self.parent
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            u = parent[head[u]]
+        return u if depth[u] < depth[v] else v
+
+    def _path_query(self, u, v):
+        total, best = 0, float('-inf')
+        for l, r in self._path_ranges(u, v):
+            s, m = self.seg.query(l, r)
+            total += s
+            best = max(best, m)
+        return total, best
+
+    def path_sum(self, u, v):
+        """
+        Time Complexity: O(log^2 n)
+        """
+        return self._path_query(u, v)[0]
+
+    def path_max(self, u, v):
+        """
+        Time Complexity: O(log^2 n)
+        """
+        return self._path_query(u, v)[1]
+
+    def path_add(self, u, v, delta):
+        """
+        Add delta to every node on the u-v path.
+        Time Complexity: O(log^2 n)
+        """
+        for l, r in self._path_ranges(u, v):
+            self.seg.range_add(l, r, delta)
+
+    def subtree_sum(self, v):
+        """
+        Time Complexity: O(log n)
+        """
+        return self.seg.query(self.pos[v], self.pos[v] + self.size[v] - 1)[0]
+
+    def subtree_max(self, v):
+        return self.seg.query(self.pos[v], self.pos[v] + self.size[v] - 1)[1]
+
+    def subtree_add(self, v, delta):
+        self.seg.range_add(self.pos[v], self.pos[v] + self.size[v] - 1, delta)
+
+    def set_value(self, v, value):
+        self.seg.point_set(self.pos[v], value)
+
+
+"""
+BENCHMARK: HLD vs naive parent walk
+
+Run from repo root: python -m dsa.tree.heavy_light_decomposition [n]
+    deep:  random "caterpillar", parent[v] = v - 1 most of the time (depth ~ n)
+    bushy: parent[v] = random node before v (depth ~ log n)
+"""
+
+
+def _naive_path_sum(parent, depth, values, u, v):
+    total = 0
+    while u != v:
+        if depth[u] < depth[v]:
+            u, v = v, u
+        total += values[u]
+        u = parent[u]
+    return total + values[u]
+
+
+def benchmark(n=10**6, queries=10**4, seed=0):
+    rng = random.Random(seed)
+    shapes = {
+        "deep": [NIL] + [v - 1 if rng.random() < 0.99 else rng.randrange(v) for v in range(1, n)],
+        "bushy": [NIL] + [rng.randrange(v) for v in range(1, n)],
+    }
+    values = [rng.randrange(100) for _ in range(n)]
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    print(f"{'tree':<8}{'build (s)':>12}{'hld q (s)':>12}{'naive q (s)':>14}")
+    for name, parent in shapes.items():
+        start = time.perf_counter()
+        hld = HeavyLightDecomposition(parent, values)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        hld_sums = [hld.path_sum(u, v) for u, v in pairs]
+        hld_time = time.perf_counter() - start
+        # naive walk is O(depth), time a slice of the queries and scale
+        sample = pairs[:max(1, queries // 100)]
+        start = time.perf_counter()
+        naive_sums = [_naive_path_sum(parent, hld.depth, values, u, v) for u, v in sample]
+        naive_time = (time.perf_counter() - start) * len(pairs) / len(sample)
+        assert naive_sums == hld_sums[:len(sample)]
+        print(f"{name:<8}{build:>12.2f}{hld_time:>12.2f}{naive_time:>14.2f}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
@@ -0,0 +1,239 @@
+"""
+LOWEST COMMON ANCESTOR (LCA)
+"""
+
+"""
+LCA(u, v): deepest node that is an ancestor of both u and v (a node is its own ancestor).
+    distance(u, v) = depth[u] + depth[v] - 2 * depth[lca(u, v)]
+
+The tree is given as a parent array (parent[root] = -1), e.g. from ArrayTree.
+All tables are NumPy arrays so batches of queries are answered with whole-array ops.
+
+1. BINARY LIFTING
+   - up[k][v] = 2^k-th ancestor of v (root maps to itself)
+   - up[k] = up[k-1][up[k-1]]   -> one fancy-indexing op per level
+   - depth comes out of the same doubling:
+        dist[k][v] = dist[k-1][v] + dist[k-1][up[k-1][v]]
+   - query:
+        1) lift the deeper node by depth difference (bits of diff)
+        2) for k from high to low: if up[k][u] != up[k][v], jump both
+        3) answer is parent of u (or u itself if u == v after step 1)
+   - Build: O(n log n), Query: O(log n), also gives kth_ancestor
+
+2. EULER TOUR + RMQ
+   - Write down nodes as a DFS enters them and every time it returns to them (2n - 1 entries)
+   - first[v] = first position of v in the tour
+   - lca(u, v) = shallowest node in tour[first[u] .. first[v]]
+   - Sparse table over tour depths (argmin) -> O(1) query, two overlapping power-of-2 ranges
+   - Build: O(n log n), Query: O(1)
+
+            1            tour:  1 2 4 2 5 2 1 3 1
+           / \\           depth: 0 1 2 1 2 1 0 1 0
+          2   3
+         / \\             lca(4, 3): tour[2 .. 7] -> min depth at node 1
+        4   5
+"""
+
+import numpy as np
+
+from dsa.tree.array_tree import NIL
+
+
+class LCA:
+
+    def __init__(self, parent, method="binary_lifting"):
+        """
+        parent: sequence / array with parent[root] = -1
+        method: "binary_lifting" or "euler_rmq"
+        """
+        if method not in ("binary_lifting", "euler_rmq"):
+            raise ValueError(f"Unknown method: {method}")
+        self.parent = np.asarray(parent, dtype=np.int32)
+        self.n = len(self.parent)
+        roots = np.flatnonzero(self.parent == NIL)
+        if len(roots) != 1:
+            raise ValueError(f"Expected exactly one root, found {len(roots)}")
+        self.root = int(roots[0])
+        self.method = method
+        self.log = max(1, (self.n - 1).bit_length())
+        self.up = None
+        if method == "binary_lifting":
+            self._build_jump_table()
+        else:
+            self._build_euler_rmq()
+
+    @classmethod
+    def from_array_tree(cls, tree, method="binary_lifting"):
+        left = np.frombuffer(tree.left, dtype=np.int32)
+        right = np.frombuffer(tree.right, dtype=np.int32)
+        parent = np.full(len(tree), NIL, dtype=np.int32)
+        ids = np.arange(len(tree), dtype=np.int32)
+        parent[left[left != NIL]] = ids[left != NIL]
+        parent[right[right != NIL]] = ids[right != NIL]
+        return cls(parent, method)
+
+    # ---------------------------------------------------------------------------------
+    # Binary lifting
+    # ---------------------------------------------------------------------------------
+
+    def _build_jump_table(self):
+        """
+        Time Complexity: O(n log n), vectorized per level
+        Space Complexity: O(n log n)
+        """
+        up = np.empty((self.log, self.n), dtype=np.int32)
+        up[0] = self.parent
+        up[0][self.root] = self.root
+        dist = (self.parent != NIL).astype(np.int32)
+        for k in range(1, self.log):
+            dist = dist + dist[up[k - 1]]
+            up[k] = up[k - 1][up[k - 1]]
+        # dist to the 2^(log-1)-th ancestor saturates at the root -> depth
+        self.depth = dist + dist[up[self.log - 1]] if self.log > 1 else dist
+        self.up = up
+
+    def _lift(self, nodes, steps):
+        for k in range(self.log):
+            mask = ((steps >> k) & 1).astype(bool)
+            if mask.any():
+                nodes = np.where(mask, self.up[k][nodes], nodes)
+        return nodes
+
+    def _lca_binary_lifting(self, u, v):
+        swap = self.depth[u] < self.depth[v]
+        u, v = np.where(swap, v, u), np.where(swap, u, v)
+        u = self._lift(u, self.depth[u] - self.depth[v])
+        for k in range(self.log - 1, -1, -1):
+            a, b = self.up[k][u], self.up[k][v]
+            differ = a != b
+            u = np.where(differ, a, u)
+            v = np.where(differ, b, v)
+        return np.where(u == v, u, self.up[0][u])
+
+    # ---------------------------------------------------------------------------------
+    # Euler tour + sparse table RMQ
+    # ---------------------------------------------------------------------------------
+
+    def _children_csr(self):
+        # children of v are kids[indptr[v]:indptr[v + 1]]
+        order = np.argsort(self.parent, kind="stable")
+        kids = order[self.parent[order] != NIL]
+        counts = np.bincount(self.parent[kids], minlength=self.n)
+        indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return indptr, kids
+
+    def _build_euler_rmq(self):
+        """
+        Iterative DFS for the tour, then a sparse table of argmin positions.
+        Time Complexity: O(n log n)
+        Space Complexity: O(n log n)
+        """
+        indptr, kids = self._children_csr()
+        ptr = indptr[:-1].tolist()
+        end = indptr[1:].tolist()
+        kids = kids.tolist()
+        depth = [0] * self.n
+        first = [0] * self.n
+        euler = [self.root]
+        stack = [self.root]
+        while stack:
+            node = stack[-1]
+            if ptr[node] < end[node]:
+                child = kids[ptr[node]]
+                ptr[node] += 1
+                depth[child] = depth[node] + 1
+                first[child] = len(euler)
+                euler.append(child)
+                stack.append(child)
+            else:
+                stack.pop()
+                if stack:
+                    euler.append(stack[-1])
+
+        self.depth = np.array(depth, dtype=np.int32)
+        self.first = np.array(first, dtype=np.int64)
+        self.euler = np.array(euler, dtype=np.int32)
+        tour_depth = self.depth[self.euler]
+        m = len(self.euler)
+        levels = max(1, m.bit_length())
+        # st[k][i] = position of the shallowest node in euler[i .. i + 2^k - 1]
+        st = np.empty((levels, m), dtype=np.int64)
+        st[0] = np.arange(m)
+        for k in range(1, levels):
+            half = 1 << (k - 1)
+            prev = st[k - 1]
+            st[k] = prev
+            a, b = prev[:m - half], prev[half:]
+            st[k][:m - half] = np.where(tour_depth[a] <= tour_depth[b], a, b)
+        self.st = st
+        self.tour_depth = tour_depth
+        # floor(log2(x)) via frexp, exact for integers
+        self.lg = np.frexp(np.arange(m + 1, dtype=np.float64))[1] - 1
+
+    def _lca_euler(self, u, v):
+        l, r = self.first[u], self.first[v]
+        l, r = np.minimum(l, r), np.maximum(l, r)
+        k = self.lg[r - l + 1]
+        a = self.st[k, l]
+        b = self.st[k, r - (1 << k) + 1]
+        pos = np.where(self.tour_depth[a] <= self.tour_depth[b], a, b)
+        return self.euler[pos]
+
+    # ---------------------------------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------------------------------
+
+    def lca_many(self, u, v):
+        """
+        Batched LCA, u and v are equal length arrays of node ids.
+        Time Complexity: O(q log n) binary lifting, O(q) euler + rmq (all vectorized)
+        """
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        if self.method == "binary_lifting":
+            return self._lca_binary_lifting(u, v)
+        return self._lca_euler(u, v)
+
+    def lca(self, u, v):
+        return int(self.lca_many([u], [v])[0])
+
+    def distance(self, u, v):
+        """
+        Number of edges on the u-v path, scalars or arrays.
+        """
+        scalar = np.isscalar(u) and np.isscalar(v)
+        u = np.atleast_1d(np.asarray(u, dtype=np.int64))
+        v = np.atleast_1d(np.asarray(v, dtype=np.int64))
+        dist = self.depth[u] + self.depth[v] - 2 * self.depth[self.lca_many(u, v)]
+        return int(dist[0]) if scalar else dist
+
+    def kth_ancestor(self, v, k):
+        """
+        k-th ancestor of v (-1 if k > depth[v]), scalars or arrays.
+        Uses the jump table, built on first use for method="euler_rmq".
+        Time Complexity: O(log n) per query
+        """
+        if self.up is None:
+            self._build_jump_table()
+        scalar = np.isscalar(v) and np.isscalar(k)
+        v = np.atleast_1d(np.asarray(v, dtype=np.int64))
+        k = np.broadcast_to(np.asarray(k, dtype=np.int64), v.shape)
+        result = np.where(k <= self.depth[v], self._lift(v, np.minimum(k, self.depth[v])), NIL)
+        return int(result[0]) if scalar else result
+
+
+"""
+COMPARISON
+==========
+
+| Method          | Build      | Memory          | LCA query | kth ancestor |
+|-----------------|------------|-----------------|-----------|--------------|
+| Naive walk      | O(n)       | O(n)            | O(depth)  | O(k)         |
+| Binary lifting  | O(n log n) | n log n int32   | O(log n)  | O(log n)     |
+| Euler + RMQ     | O(n log n) | 2n log 2n int64 | O(1)      | via lifting  |
+
+For n = 10^6: jump table ~ 80 MB, Euler sparse table ~ 330 MB.
+Batch queries through lca_many: the per-query Python overhead disappears and
+the cost is a handful of NumPy gathers over the whole query array.
+"""
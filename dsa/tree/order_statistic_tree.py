@@ -0,0 +1,329 @@
+"""
+ORDER STATISTIC TREE
+"""
+
+"""
+1. WHAT IS AN ORDER STATISTIC TREE?
+   - A balanced BST where every node also stores the size of its subtree
+   - size(node) = size(node.left) + size(node.right) + 1
+   - With subtree sizes we can answer positional questions in O(log n):
+       rank(x)            -> number of keys < x
+       select(k)          -> k-th smallest key (0-indexed)
+       count_range(a, b)  -> number of keys in [a, b] = rank(b, inclusive) - rank(a)
+
+2. BALANCING: TREAP
+   - Each node gets a random priority, tree is a BST on keys and a heap on priorities
+   - Expected height O(log n) without any rotation bookkeeping
+   - Everything is built from two primitives:
+       split(t, key) -> (keys < key, keys >= key)
+       merge(l, r)   -> all keys of l are < all keys of r
+   - sizes only need fixing on the nodes split / merge touch (O(log n) of them)
+
+3. RANK:
+        walk down from root, keep `offset`
+        key < node.key  -> go left
+        key > node.key  -> offset += size(left) + 1, go right
+        key == node.key -> answer = offset + size(left)
+
+4. SELECT(k):
+        left_size = size(node.left)
+        k < left_size   -> go left
+        k == left_size  -> node
+        k > left_size   -> k -= left_size + 1, go right
+
+5. BULK RANK (merged traversal):
+   - Instead of m independent root-to-leaf walks, push the sorted probes down the tree together
+   - At each node the probes are partitioned with bisect into (< key, == key, > key)
+   - Shared path prefixes are walked once
+"""
+
+import random
+from bisect import bisect_left, bisect_right
+
+
+class OSTNode:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key):
+        self.key = key
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _split(node, key):
+    """
+    Split into (keys < key, keys >= key).
+    Time Complexity: O(log n) expected
+    """
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    """
+    Merge two treaps where every key in left < every key in right.
+    Time Complexity: O(log n) expected
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+class OrderStatisticTree:
+    """
+    Treap augmented with subtree sizes.
+    No duplicate keys (like BinarySearchTree).
+    """
+
+    def __init__(self, keys=()):
+        self.root = None
+        for key in keys:
+            self.add(key)
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """
+        Bulk-load from strictly increasing keys.
+        Cartesian tree construction: keys arrive in order, so each new node can only
+        land on the right spine. Pop the spine while its priority is lower than the
+        new node's, hang the popped chain as the new node's left child.
+
+        Time Complexity: O(n) (each node pushed / popped once)
+        """
+        tree = cls()
+        spine = []
+        prev = None
+        for key in keys:
+            if prev is not None and prev >= key:
+                raise ValueError(f"Keys must be strictly increasing, got {prev} before {key}")
+            prev = key
+            node = OSTNode(key)
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+                _update(last)
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        for node in reversed(spine):
+            _update(node)
+        tree.root = spine[0] if spine else None
+        return tree
+
+    def split(self, key):
+        """
+        Split into two trees (keys < key, keys >= key). This tree is emptied.
+        Time Complexity: O(log n) expected
+        """
+        left, right = type(self)(), type(self)()
+        left.root, right.root = _split(self.root, key)
+        self.root = None
+        return left, right
+
+    @classmethod
+    def join(cls, left, right):
+        """
+        Concatenate two trees where every key in left < every key in right.
+        Both input trees are emptied.
+        Time Complexity: O(log n) expected
+        """
+        if left.root and right.root and left.select(len(left) - 1) >= right.select(0):
+            raise ValueError("All keys of left must be smaller than all keys of right")
+        tree = cls()
+        tree.root = _merge(left.root, right.root)
+        left.root = right.root = None
+        return tree
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, key):
+        node = self.root
+        while node:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while node or stack:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def add(self, key):
+        """
+        Insert key, returns False if it was already present.
+        Time Complexity: O(log n) expected
+        """
+        if key in self:
+            return False
+        left, right = _split(self.root, key)
+        self.root = _merge(_merge(left, OSTNode(key)), right)
+        return True
+
+    def remove(self, key):
+        """
+        Remove key, returns False if it was not present.
+        Time Complexity: O(log n) expected
+        """
+        if key not in self:
+            return False
+        self.root = self._remove(self.root, key)
+        return True
+
+    def _remove(self, node, key):
+        if key == node.key:
+            return _merge(node.left, node.right)
+        if key < node.key:
+            node.left = self._remove(node.left, key)
+        else:
+            node.right = self._remove(node.right, key)
+        _update(node)
+        return node
+
+    def rank(self, key, inclusive=False):
+        """
+        Number of keys < key (<= key if inclusive).
+        Time Complexity: O(log n)
+        """
+        node = self.root
+        offset = 0
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                offset += _size(node.left) + 1
+                node = node.right
+            else:
+                return offset + _size(node.left) + (1 if inclusive else 0)
+        return offset
+
+    def select(self, k):
+        """
+        k-th smallest key (0-indexed).
+        Time Complexity: O(log n)
+        """
+        if k < 0 or k >= len(self):
+            raise IndexError(f"Invalid rank: {k}. Valid range is [0, {len(self) - 1}]")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, a, b):
+        """
+        Number of keys in [a, b].
+        Time Complexity: O(log n)
+        """
+        if a > b:
+            return 0
+        return self.rank(b, inclusive=True) - self.rank(a)
+
+    def iter_range(self, a, b):
+        """
+        Yield keys in [a, b] in sorted order.
+        Only subtrees overlapping [a, b] are visited.
+        Time Complexity: O(log n + k) where k is the number of keys yielded
+        """
+        stack = []
+        node = self.root
+        while node or stack:
+            # go left only while keys there can still be >= a
+            while node:
+                if node.key < a:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > b:
+                return
+            yield node.key
+            node = node.right
+
+    def rank_many(self, probes):
+        """
+        rank() for a sorted list of probes using one merged traversal.
+        Returns ranks in the same order as probes.
+        Time Complexity: O(m log n) worst, shared path prefixes walked once
+        """
+        result = [0] * len(probes)
+        stack = [(self.root, 0, len(probes), 0)]
+        while stack:
+            node, lo, hi, offset = stack.pop()
+            if lo >= hi:
+                continue
+            if node is None:
+                for i in range(lo, hi):
+                    result[i] = offset
+                continue
+            mid_lo = bisect_left(probes, node.key, lo, hi)
+            mid_hi = bisect_right(probes, node.key, mid_lo, hi)
+            here = offset + _size(node.left)
+            for i in range(mid_lo, mid_hi):
+                result[i] = here
+            stack.append((node.left, lo, mid_lo, offset))
+            stack.append((node.right, mid_hi, hi, here + 1))
+        return result
+
+
+"""
+COMPLEXITY ANALYSIS
+==================
+
+| Operation          | BinarySearchTree | OrderStatisticTree     |
+|--------------------|------------------|------------------------|
+| add / remove       | O(h), h <= n     | O(log n) expected      |
+| rank / select      | O(n) (inorder)   | O(log n)               |
+| count_range(a, b)  | O(n)             | O(log n)               |
+| iter_range(a, b)   | O(n)             | O(log n + k)           |
+| rank_many (m keys) | O(m * n)         | O(m log n), shared     |
+| from_sorted        | O(n) (balanced)  | O(n) (Cartesian tree)  |
+| split / join       | O(n) rebuild     | O(log n) expected      |
+
+Space: O(n), one extra int (size) and float (priority) per node.
+
+ALTERNATIVES:
+   - Fenwick tree over compressed keys: when the key universe is known up front
+   - Sorted list + bisect: O(1) rank via bisect but O(n) inserts
+"""
@@ -251,3 +251,123 @@ COMPLEXITY ANALYSIS
    - Sqrt Decomposition: For simple range queries
 """
 
+
+# =====================================================================================
+# ITERATIVE LAZY SEGMENT TREE (RANGE ADD, RANGE SUM + MAX)
+# =====================================================================================
+
+"""
+Bottom-up (non recursive) lazy segment tree.
+    - size = next power of 2, leaves at [size, 2*size), node i has children 2i, 2i+1
+    - every node keeps (sum, max) of its segment, internal nodes keep a pending `add`
+    - before touching a range, push pending adds down along the two boundary paths
+      (only the O(log n) ancestors of l and r can hold adds that matter)
+    - after an update, pull (sum, max) back up along the same two paths
+No Python recursion, which matters when it is driven O(log n) times per query (e.g. HLD).
+"""
+
+class RangeAddSegmentTree:
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        self.log = max(1, (self.n - 1).bit_length())
+        self.size = 1 << self.log
+        size = self.size
+        self.sum = [0] * (2 * size)
+        self.max = [float('-inf')] * (2 * size) # identity, padding leaves stay -inf
+        self.width = [0] * (2 * size)           # number of real leaves under a node
+        self.lazy = [0] * size
+        for i, value in enumerate(arr):
+            self.sum[size + i] = value
+            self.max[size + i] = value
+            self.width[size + i] = 1
+        for i in range(size - 1, 0, -1):
+            self.width[i] = self.width[2 * i] + self.width[2 * i + 1]
+            self._pull(i)
+
+    def _pull(self, i):
+        self.sum[i] = self.sum[2 * i] + self.sum[2 * i + 1]
+        self.max[i] = max(self.max[2 * i], self.max[2 * i + 1])
+
+    def _apply(self, i, value):
+        self.sum[i] += value * self.width[i]
+        self.max[i] += value
+        if i < self.size:
+            self.lazy[i] += value
+
+    def _push(self, i):
+        if self.lazy[i]:
+            self._apply(2 * i, self.lazy[i])
+            self._apply(2 * i + 1, self.lazy[i])
+            self.lazy[i] = 0
+
+    def _push_boundaries(self, l, r):
+        # l, r are leaf indices of the half open range [l, r)
+        for i in range(self.log, 0, -1):
+            if ((l >> i) << i) != l:
+                self._push(l >> i)
+            if ((r >> i) << i) != r:
+                self._push((r - 1) >> i)
+
+    def _check(self, left, right):
+        if left < 0 or right >= self.n or left > right:
+            raise ValueError(f"Invalid range: [{left}, {right}]. Valid range is [0, {self.n-1}]")
+
+    def range_add(self, left, right, value):
+        """
+        Add value to every element in [left, right].
+        Time Complexity: O(log n)
+        """
+        self._check(left, right)
+        l, r = left + self.size, right + 1 + self.size
+        self._push_boundaries(l, r)
+        l2, r2 = l, r
+        while l2 < r2:
+            if l2 & 1:
+                self._apply(l2, value)
+                l2 += 1
+            if r2 & 1:
+                r2 -= 1
+                self._apply(r2, value)
+            l2 >>= 1
+            r2 >>= 1
+        for i in range(1, self.log + 1):
+            if ((l >> i) << i) != l:
+                self._pull(l >> i)
+            if ((r >> i) << i) != r:
+                self._pull((r - 1) >> i)
+
+    def point_set(self, index, value):
+        """
+        Time Complexity: O(log n)
+        """
+        self._check(index, index)
+        i = index + self.size
+        for k in range(self.log, 0, -1):
+            self._push(i >> k)
+        self.sum[i] = value
+        self.max[i] = value
+        for k in range(1, self.log + 1):
+            self._pull(i >> k)
+
+    def query(self, left, right):
+        """
+        (sum, max) of [left, right].
+        Time Complexity: O(log n)
+        """
+        self._check(left, right)
+        l, r = left + self.size, right + 1 + self.size
+        self._push_boundaries(l, r)
+        total, best = 0, float('-inf')
+        while l < r:
+            if l & 1:
+                total += self.sum[l]
+                best = max(best, self.max[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                total += self.sum[r]
+                best = max(best, self.max[r])
+            l >>= 1
+            r >>= 1
+        return total, best
@@ -0,0 +1,378 @@
+"""
+SORTED LIST (CHUNKED, B+ TREE LIKE)
+"""
+
+"""
+1. WHY NOT A POINTER BASED BST?
+   - One Python object per key (~100+ bytes with key, left, right, parent)
+   - Every step of a search is a pointer chase to a random place in memory (cache miss)
+   - Unbalanced insertion order (sorted keys) degrades to O(n) height
+
+2. IDEA:
+   - Keep the keys in a list of sorted chunks (like the leaf level of a B+ tree)
+   - Every chunk holds between load/2 and 2*load keys
+   - `maxes[i]` is the largest key in chunk i -> bisect over maxes picks the chunk
+   - bisect inside the chunk picks the slot (contiguous memory, cheap memmove on insort)
+   - Positional index: Fenwick tree over chunk lengths
+       -> global index <-> (chunk, offset) in O(log(n / load))
+
+        maxes:   [  9      |   25        |   40      ]
+        chunks:  [1 4 7 9] [12 15 20 25] [31 33 40]
+
+3. CHUNK MAINTENANCE:
+   - chunk grows above 2*load      -> split into two halves
+   - chunk shrinks below load/2    -> merge with a neighbour (and re-split if too big)
+   - split / merge change the chunk count -> rebuild the Fenwick tree in O(n / load)
+
+4. TIME COMPLEXITIES (load = L):
+   - add / remove: O(log n + L) (insort shifts at most 2L pointers, memmove fast)
+   - bisect, __contains__: O(log n)
+   - index access: O(log(n / L))
+   - slicing / irange: O(log n + k)
+   - iteration: O(n), chunk by chunk
+"""
+
+import time
+import tracemalloc
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+
+
+class SortedList:
+    """
+    Ordered container built from sorted chunks.
+    Duplicates are allowed.
+    """
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, iterable=(), load=DEFAULT_LOAD):
+        self._load = load
+        self._len = 0
+        self._lists = []
+        self._maxes = []
+        self._fenwick = [0]
+        values = sorted(iterable)
+        if values:
+            self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+            self._maxes = [chunk[-1] for chunk in self._lists]
+            self._len = len(values)
+            self._build_index()
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        for chunk in reversed(self._lists):
+            yield from reversed(chunk)
+
+    def __repr__(self):
+        return f"SortedList({list(self)})"
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        idx = bisect_left(chunk, value)
+        return chunk[idx] == value
+
+    # ---------------------------------------------------------------------------------
+    # Fenwick tree over chunk lengths (positional index)
+    # ---------------------------------------------------------------------------------
+
+    def _build_index(self):
+        """
+        Time Complexity: O(number of chunks)
+        """
+        tree = [0] + [len(chunk) for chunk in self._lists]
+        n = len(self._lists)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        self._fenwick = tree
+
+    def _index_add(self, pos, delta):
+        tree = self._fenwick
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _index_prefix(self, pos):
+        # number of keys in chunks [0, pos)
+        tree = self._fenwick
+        total = 0
+        while pos:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _index_locate(self, index):
+        # global index -> (chunk, offset inside chunk)
+        tree = self._fenwick
+        n = len(tree) - 1
+        pos = 0
+        mask = 1 << (n.bit_length() - 1) if n else 0
+        while mask:
+            nxt = pos + mask
+            if nxt <= n and tree[nxt] <= index:
+                index -= tree[nxt]
+                pos = nxt
+            mask >>= 1
+        return pos, index
+
+    # ---------------------------------------------------------------------------------
+    # Chunk maintenance
+    # ---------------------------------------------------------------------------------
+
+    def _expand(self, pos):
+        chunk = self._lists[pos]
+        if len(chunk) <= 2 * self._load:
+            self._index_add(pos, 1)
+            return
+        half = chunk[self._load:]
+        del chunk[self._load:]
+        self._maxes[pos] = chunk[-1]
+        self._lists.insert(pos + 1, half)
+        self._maxes.insert(pos + 1, half[-1])
+        self._build_index()
+
+    def _shrink(self, pos):
+        chunk = self._lists[pos]
+        if len(chunk) >= self._load // 2:
+            self._maxes[pos] = chunk[-1]
+            self._index_add(pos, -1)
+            return
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+        elif len(self._lists) > 1:
+            # merge into the previous chunk (or the next one for the first chunk)
+            if pos == 0:
+                pos = 1
+            prev = self._lists[pos - 1]
+            prev.extend(self._lists[pos])
+            self._maxes[pos - 1] = prev[-1]
+            del self._lists[pos]
+            del self._maxes[pos]
+            if len(prev) > 2 * self._load:
+                half = prev[len(prev) // 2:]
+                del prev[len(prev) // 2:]
+                self._maxes[pos - 1] = prev[-1]
+                self._lists.insert(pos, half)
+                self._maxes.insert(pos, half[-1])
+        else:
+            self._maxes[pos] = chunk[-1]
+        self._build_index()
+
+    # ---------------------------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------------------------
+
+    def add(self, value):
+        """
+        Time Complexity: O(log n + load)
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+            self._build_index()
+        else:
+            pos = bisect_right(maxes, value)
+            if pos == len(maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            self._expand(pos)
+        self._len += 1
+
+    def update(self, iterable):
+        for value in iterable:
+            self.add(value)
+
+    def discard(self, value):
+        """
+        Remove one occurrence of value, returns False if not present.
+        Time Complexity: O(log n + load)
+        """
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        idx = bisect_left(chunk, value)
+        if chunk[idx] != value:
+            return False
+        del chunk[idx]
+        self._len -= 1
+        self._shrink(pos)
+        return True
+
+    def remove(self, value):
+        if not self.discard(value):
+            raise ValueError(f"{value} not in list")
+
+    def bisect_left(self, value):
+        """
+        Index where value would be inserted (before any equal keys).
+        Time Complexity: O(log n)
+        """
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._index_prefix(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        """
+        Index where value would be inserted (after any equal keys).
+        Time Complexity: O(log n)
+        """
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._index_prefix(pos) + bisect_right(self._lists[pos], value)
+
+    bisect = bisect_right
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value):
+        idx = self.bisect_left(value)
+        if idx == self._len or self[idx] != value:
+            raise ValueError(f"{value} not in list")
+        return idx
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= self._len:
+            raise IndexError('Index out of range')
+        return index
+
+    def __getitem__(self, index):
+        """
+        Time Complexity: O(log(n / load)) for an int, O(log n + k) for a slice
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._islice(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        pos, idx = self._index_locate(self._normalize(index))
+        return self._lists[pos][idx]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            for i in sorted(range(start, stop, step), reverse=True):
+                del self[i]
+            return
+        pos, idx = self._index_locate(self._normalize(index))
+        del self._lists[pos][idx]
+        self._len -= 1
+        self._shrink(pos)
+
+    def pop(self, index=-1):
+        value = self[index]
+        del self[index]
+        return value
+
+    def _islice(self, start, stop):
+        # yield keys at positions [start, stop) chunk by chunk
+        if start >= stop:
+            return
+        pos, idx = self._index_locate(start)
+        remaining = stop - start
+        while remaining > 0 and pos < len(self._lists):
+            chunk = self._lists[pos]
+            taken = chunk[idx:idx + remaining]
+            yield from taken
+            remaining -= len(taken)
+            pos, idx = pos + 1, 0
+
+    def irange(self, minimum, maximum, inclusive=(True, True)):
+        """
+        Yield keys between minimum and maximum in sorted order.
+        Time Complexity: O(log n + k)
+        """
+        start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        return self._islice(start, stop)
+
+
+"""
+BENCHMARK: SortedList vs BinarySearchTree
+
+Run from repo root: python -m dsa.tree.sorted_list [n]
+The requested comparison is n = 10**7; BinarySearchTree needs several GB
+and minutes at that size, so the default is smaller.
+"""
+
+
+def _measure(build, n):
+    start = time.perf_counter()
+    container, contains = build()
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in range(0, 2 * n, 7):
+        contains(container, key)
+    search_time = time.perf_counter() - start
+    del container
+    # second build under tracemalloc, tracing slows down the timed run otherwise
+    tracemalloc.start()
+    container, _ = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return build_time, search_time, memory
+
+
+def benchmark(n=10**6, seed=0):
+    import random
+    from dsa.tree.bst import BinarySearchTree
+
+    rng = random.Random(seed)
+    keys = rng.sample(range(2 * n), n)
+
+    def build_sorted_list():
+        sl = SortedList()
+        for key in keys:
+            sl.add(key)
+        return sl, SortedList.__contains__
+
+    def build_bst():
+        bst = BinarySearchTree()
+        for key in keys:
+            bst.insert(key)
+        return bst, BinarySearchTree.search
+
+    print(f"{'container':<18}{'insert (s)':>12}{'search (s)':>12}{'memory (MB)':>14}")
+    for name, build in (("SortedList", build_sorted_list), ("BinarySearchTree", build_bst)):
+        build_time, search_time, memory = _measure(build, n)
+        print(f"{name:<18}{build_time:>12.2f}{search_time:>12.2f}{memory / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
+
+
+"""
+COMPARISON
+==========
+
+| Operation        | BinarySearchTree       | SortedList                     |
+|------------------|------------------------|--------------------------------|
+| insert / delete  | O(h), h up to n        | O(log n + load), no rebalance  |
+| search           | O(h), pointer chasing  | O(log n), two bisects          |
+| k-th element     | O(n)                   | O(log(n / load))               |
+| range [a, b]     | O(h + k)               | O(log n + k), contiguous       |
+| memory per key   | 1 node object          | 1 list slot (8 bytes)          |
+"""
@@ -0,0 +1,229 @@
+"""
+BINARY TREE SERIALIZATION (STREAMING, LEVEL ORDER + PRESENCE BITMAP)
+"""
+
+"""
+1. FORMAT:
+   - Nodes are written in level order
+   - Every node contributes 2 presence bits: (has left child, has right child)
+   - Values are written as a packed fixed-width array (array / NumPy typecode, little endian)
+
+        header: b"BTRE" | version (1 byte) | value typecode (1 byte)
+        chunk:  count k (uint32) | bitmap ceil(2k / 8) bytes | k values
+        ...
+        end:    count 0
+
+   - A tree with n nodes costs 2n bits + n * itemsize bytes (no per-node pointers)
+
+2. WHY LEVEL ORDER?
+   - Child ids follow directly from the bits: scanning nodes in level order, every
+     set bit is the next unseen node, so
+        child id = running count of set bits so far
+   - That is a cumsum over the bitmap -> decoding is vectorized per chunk
+   - Decoded ids are level order ids, loaded straight into ArrayTree parallel arrays
+
+3. STREAMING:
+   - Encoder walks the tree one level (frontier) at a time and flushes fixed-size chunks
+   - Decoder reads chunk by chunk, memory is O(chunk) plus the output arrays
+   - No recursion anywhere, depth of the tree does not matter
+"""
+
+import pickle
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+
+import numpy as np
+
+from dsa.tree.array_tree import ArrayTree, NIL
+
+MAGIC = b"BTRE"
+VERSION = 1
+HEADER = struct.Struct("<4sBc")
+CHUNK = struct.Struct("<I")
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class _ChunkWriter:
+
+    def __init__(self, fileobj, typecode, chunk_size):
+        self.fileobj = fileobj
+        self.dtype = np.dtype(typecode).newbyteorder("<")
+        self.chunk_size = chunk_size
+        self.bits = []
+        self.values = []
+        self.pending = 0
+        fileobj.write(HEADER.pack(MAGIC, VERSION, typecode.encode()))
+
+    def add(self, has_left, has_right, values):
+        """
+        Buffer presence flags / values for a run of level order nodes.
+        """
+        bits = np.empty(2 * len(values), dtype=bool)
+        bits[0::2] = has_left
+        bits[1::2] = has_right
+        self.bits.append(bits)
+        self.values.append(np.asarray(values, dtype=self.dtype))
+        self.pending += len(values)
+        while self.pending >= self.chunk_size:
+            self._flush(self.chunk_size)
+
+    def _flush(self, count):
+        bits = np.concatenate(self.bits)
+        values = np.concatenate(self.values)
+        self.fileobj.write(CHUNK.pack(count))
+        self.fileobj.write(np.packbits(bits[:2 * count]).tobytes())
+        self.fileobj.write(values[:count].tobytes())
+        self.bits = [bits[2 * count:]]
+        self.values = [values[count:]]
+        self.pending -= count
+
+    def close(self):
+        if self.pending:
+            self._flush(self.pending)
+        self.fileobj.write(CHUNK.pack(0))
+
+
+def dump(tree, fileobj, typecode="q", chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Serialize an ArrayTree, one NumPy frontier (level) at a time.
+    Time Complexity: O(n)
+    Space Complexity: O(max level width + chunk_size)
+    """
+    writer = _ChunkWriter(fileobj, typecode, chunk_size)
+    left = np.frombuffer(tree.left, dtype=np.int32)
+    right = np.frombuffer(tree.right, dtype=np.int32)
+    values = tree.values if isinstance(tree.values, np.ndarray) else None
+    for level in tree.level_order_numpy():
+        level_values = values[level] if values is not None else tree.values_of(level.tolist())
+        writer.add(left[level] != NIL, right[level] != NIL, level_values)
+    writer.close()
+
+
+def dump_treenode(root, fileobj, typecode="q", chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Serialize a TreeNode tree directly (BFS over node objects).
+    Time Complexity: O(n)
+    """
+    writer = _ChunkWriter(fileobj, typecode, chunk_size)
+    queue = deque([root] if root else [])
+    while queue:
+        batch = [queue.popleft() for _ in range(min(len(queue), chunk_size))]
+        has_left = [node.left is not None for node in batch]
+        has_right = [node.right is not None for node in batch]
+        writer.add(has_left, has_right, [node.val for node in batch])
+        for node in batch:
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+    writer.close()
+
+
+def _read_exact(fileobj, size):
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated tree stream")
+    return data
+
+
+def _read_header(fileobj):
+    magic, version, typecode = HEADER.unpack(_read_exact(fileobj, HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a tree stream or unsupported version")
+    return typecode.decode()
+
+
+def iter_chunks(fileobj):
+    """
+    Streaming decoder.
+    Yields (left, right, values) NumPy arrays per chunk, ids are level order ids.
+    Time Complexity: O(n), vectorized per chunk
+    """
+    return _iter_body(fileobj, _read_header(fileobj))
+
+
+def _iter_body(fileobj, typecode):
+    dtype = np.dtype(typecode).newbyteorder("<")
+    next_id = 1  # root is id 0
+    decoded = 0
+    while True:
+        (count,) = CHUNK.unpack(_read_exact(fileobj, CHUNK.size))
+        if count == 0:
+            break
+        packed = np.frombuffer(_read_exact(fileobj, (2 * count + 7) // 8), dtype=np.uint8)
+        bits = np.unpackbits(packed)[:2 * count].astype(bool)
+        values = np.frombuffer(_read_exact(fileobj, count * dtype.itemsize), dtype=dtype)
+        ids = next_id + np.cumsum(bits, dtype=np.int64) - 1
+        left = np.where(bits[0::2], ids[0::2], NIL).astype(np.int32)
+        right = np.where(bits[1::2], ids[1::2], NIL).astype(np.int32)
+        next_id += int(bits.sum())
+        decoded += count
+        yield left, right, values
+    if decoded and next_id != decoded:
+        raise ValueError(f"Corrupt tree stream: {next_id} nodes referenced, {decoded} decoded")
+
+
+def load(fileobj):
+    """
+    Decode straight into an ArrayTree (values as array, no TreeNode objects).
+    Time Complexity: O(n)
+    """
+    typecode = _read_header(fileobj)
+    tree = ArrayTree()
+    tree.values = array(typecode)
+    for left, right, values in _iter_body(fileobj, typecode):
+        tree.left.frombytes(left.tobytes())
+        tree.right.frombytes(right.tobytes())
+        tree.values.frombytes(values.astype(typecode).tobytes())
+    tree.root = 0 if len(tree.values) else NIL
+    return tree
+
+
+"""
+BENCHMARK: streaming format vs pickle of TreeNode
+
+Run from repo root: python -m dsa.tree.tree_serialization [n]
+"""
+
+
+def benchmark(n=10**6, seed=0):
+    import io
+    import random
+
+    rng = random.Random(seed)
+    tree = ArrayTree()
+    tree.add_node(rng.randrange(1 << 30))
+    free = [(0, True), (0, False)]
+    for _ in range(n - 1):
+        i = rng.randrange(len(free))
+        free[i], free[-1] = free[-1], free[i]
+        parent, is_left = free.pop()
+        node = tree.add_node(rng.randrange(1 << 30), parent, is_left)
+        free.extend(((node, True), (node, False)))
+
+    buf = io.BytesIO()
+    start = time.perf_counter()
+    dump(tree, buf)
+    dump_time = time.perf_counter() - start
+    buf.seek(0)
+    start = time.perf_counter()
+    load(buf)
+    load_time = time.perf_counter() - start
+    print(f"stream: dump {dump_time:.2f}s load {load_time:.2f}s size {len(buf.getvalue()) / 2**20:.1f} MB")
+
+    # pickle recurses once per tree level, fine for this random (shallow) tree
+    root = tree.to_treenode()
+    start = time.perf_counter()
+    data = pickle.dumps(root, protocol=pickle.HIGHEST_PROTOCOL)
+    dump_time = time.perf_counter() - start
+    start = time.perf_counter()
+    pickle.loads(data)
+    load_time = time.perf_counter() - start
+    print(f"pickle: dump {dump_time:.2f}s load {load_time:.2f}s size {len(data) / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)